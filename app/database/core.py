@@ -53,6 +53,24 @@ def _register_spatialite_extension(engine):
     # Attach listener so every new DB-API connection loads SpatiaLite
     event.listen(engine, "connect", _on_connect)
 
+def _register_sqlite_pragmas(engine):
+    """
+    Register a per-connection hook that switches SQLite to write-ahead logging,
+    so commits only append to the WAL instead of rewriting the rollback journal,
+    and readers (e.g. the background table loads) don't block on writers.
+    """
+    def _on_connect(dbapi_connection, connection_record):
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            # Safe with WAL: only a power loss can drop the last commits, never corrupt the file
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+        except Exception as e:
+            print(f"Warning: Failed to enable SQLite WAL mode: {e}")
+
+    event.listen(engine, "connect", _on_connect)
+
 # Explicit model for the 'platforms' table matching the user's schema.
 # We are telling SQLAlchemy that 'id' is the primary key for ORM purposes,
 # which allows automap to work even if it's not a PK in the DB schema.
@@ -96,9 +114,11 @@ def get_session_and_models(db_path: str) -> tuple:
             print(f"Error: Database file not found at {db_path}")
             return None, None
 
-        engine = create_engine(f"sqlite:///{db_path}")
+        # A larger compiled-statement cache keeps the app's many repeated queries from being recompiled
+        engine = create_engine(f"sqlite:///{db_path}", query_cache_size=1200)
         # Ensure SpatiaLite extension loads for each connection
         _register_spatialite_extension(engine)
+        _register_sqlite_pragmas(engine)
         Session = sessionmaker(bind=engine)
         session = Session()
 
@@ -11,6 +11,9 @@ class DatabaseManager(QObject):
     connection_set = Signal()
     platforms_updated = Signal()  # Emitted when platforms are added, updated, or deleted
     systems_updated = Signal()   # Emitted when systems are added, updated, or deleted
+    missions_updated = Signal()  # Emitted when missions are added, updated, or deleted
+    sites_updated = Signal()     # Emitted when sites are added, updated, or deleted
+    processing_updated = Signal()  # Emitted when processing entries are added, updated, or deleted
 
     def __init__(self):
         super().__init__()
@@ -41,6 +44,21 @@ class DatabaseManager(QObject):
             return None
         return self.models.get(model_name)
 
+    def emit_table_updated(self, table_name: str):
+        """
+        Emits the change signal for a table edited generically (e.g., from the DB editor),
+        so components caching its rows refresh. Tables without a signal are ignored.
+        """
+        signal = {
+            'platforms': self.platforms_updated,
+            'systems': self.systems_updated,
+            'missions': self.missions_updated,
+            'sites': self.sites_updated,
+            'processing': self.processing_updated,
+        }.get(table_name)
+        if signal is not None:
+            signal.emit()
+
     def get_all_platforms(self):
         """Fetches all platforms from the database."""
         if not self.session:
@@ -18,6 +18,24 @@ from datetime import datetime
 from sqlalchemy import text
 from app.database.manager import db_manager
 
+# All missions sharing the grouping fields of the first mission with the given Mission_ID,
+# found with one self-join. Dates are compared as calendar days, matching _group_missions_by_criteria.
+GROUP_MISSIONS_QUERY = text("""
+    SELECT
+        m.id, m.mission_id, COALESCE(date(m.date), m.date) AS date, m.platform, m.chassis,
+        m.customer, m.site, m.altitude_m, m.speed_m_s, m.spacing_m, m.outcome
+    FROM missions r
+    JOIN missions m
+        ON COALESCE(date(m.date), m.date) IS COALESCE(date(r.date), r.date)
+        AND m.chassis IS r.chassis
+        AND m.customer IS r.customer
+        AND m.site IS r.site
+        AND m.altitude_m IS r.altitude_m
+        AND m.speed_m_s IS r.speed_m_s
+        AND m.spacing_m IS r.spacing_m
+    WHERE r.id = (SELECT id FROM missions WHERE mission_id = :mission_id LIMIT 1)
+""")
+
 
 class MissionGroupingService:
     """Service for automatically grouping missions and assigning Mission_IDs."""
@@ -103,44 +121,12 @@ class MissionGroupingService:
             return []
 
         try:
-            Mission = db_manager.get_model('missions')
-            if not Mission:
-                return []
-
-            # Find one mission with this Mission_ID to get the grouping criteria
-            reference_mission = db_manager.session.query(Mission).filter_by(mission_id=mission_id).first()
-            if not reference_mission:
+            if not db_manager.get_model('missions'):
                 return []
 
-            # Find all missions with the same grouping criteria
-            group_missions = db_manager.session.query(Mission).filter(
-                Mission.date == reference_mission.date,
-                Mission.chassis == reference_mission.chassis,
-                Mission.customer == reference_mission.customer,
-                Mission.site == reference_mission.site,
-                Mission.altitude_m == reference_mission.altitude_m,
-                Mission.speed_m_s == reference_mission.speed_m_s,
-                Mission.spacing_m == reference_mission.spacing_m
-            ).all()
-
-            # Convert to dictionaries
-            result = []
-            for mission in group_missions:
-                result.append({
-                    'id': mission.id,
-                    'mission_id': mission.mission_id,
-                    'date': mission.date.strftime('%Y-%m-%d') if mission.date else None,
-                    'platform': mission.platform,
-                    'chassis': mission.chassis,
-                    'customer': mission.customer,
-                    'site': mission.site,
-                    'altitude_m': mission.altitude_m,
-                    'speed_m_s': mission.speed_m_s,
-                    'spacing_m': mission.spacing_m,
-                    'outcome': mission.outcome
-                })
-
-            return result
+            # Reference mission and its group members in a single query, as plain dictionaries
+            result = db_manager.session.execute(GROUP_MISSIONS_QUERY, {'mission_id': mission_id})
+            return [dict(row) for row in result.mappings()]
 
         except Exception as e:
             print(f"Error getting missions in group: {e}")
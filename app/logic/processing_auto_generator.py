@@ -17,27 +17,30 @@ class ProcessingAutoGenerator:
     def __init__(self):
         self._processed_mission_ids = set()  # Cache of Mission_IDs that have processing entries
 
-    def generate_processing_entries(self, force_update: bool = False) -> Dict[str, str]:
+    def generate_processing_entries(self, force_update: bool = False, session=None) -> Dict[str, str]:
         """
         Generate processing entries for all Mission_IDs that don't have them.
 
         Args:
             force_update: Whether to update existing processing entries
+            session: Session to work in; defaults to the shared db_manager session.
+                     Pass a dedicated session when calling from a worker thread.
 
         Returns:
             Dictionary mapping Mission_IDs to processing entry status
         """
-        if not db_manager.session:
+        session = session or db_manager.session
+        if not session:
             raise RuntimeError("Database session not available")
 
         try:
             # Get all unique Mission_IDs from missions table
-            mission_ids = self._get_all_mission_ids()
+            mission_ids = self._get_all_mission_ids(session)
             if not mission_ids:
                 return {"status": "No Mission_IDs found"}
 
             # Get existing processing entries
-            existing_processing = self._get_existing_processing_entries()
+            existing_processing = self._get_existing_processing_entries(session)
 
             results = {}
             created_count = 0
@@ -47,19 +50,19 @@ class ProcessingAutoGenerator:
                 if mission_id in existing_processing:
                     if force_update:
                         # Update existing entry
-                        self._update_processing_entry(mission_id, existing_processing[mission_id])
+                        self._update_processing_entry(mission_id, existing_processing[mission_id], session)
                         results[str(mission_id)] = "updated"
                         updated_count += 1
                     else:
                         results[str(mission_id)] = "exists"
                 else:
                     # Create new entry
-                    self._create_processing_entry(mission_id)
+                    self._create_processing_entry(mission_id, session)
                     results[str(mission_id)] = "created"
                     created_count += 1
 
             # Commit all changes
-            db_manager.session.commit()
+            session.commit()
 
             # Update cache
             self._processed_mission_ids.update(mission_ids)
@@ -68,7 +71,7 @@ class ProcessingAutoGenerator:
             return results
 
         except Exception as e:
-            db_manager.session.rollback()
+            session.rollback()
             raise RuntimeError(f"Failed to generate processing entries: {e}")
 
     def sync_processing_entries(self) -> Dict[str, str]:
@@ -121,15 +124,16 @@ class ProcessingAutoGenerator:
             db_manager.session.rollback()
             raise RuntimeError(f"Failed to sync processing entries: {e}")
 
-    def _get_all_mission_ids(self) -> List[int]:
+    def _get_all_mission_ids(self, session=None) -> List[int]:
         """Get all unique Mission_IDs from the missions table."""
+        session = session or db_manager.session
         try:
             Mission = db_manager.get_model('missions')
             if not Mission:
                 return []
 
             # Get distinct Mission_IDs that are not null
-            mission_ids = db_manager.session.query(Mission.mission_id).filter(
+            mission_ids = session.query(Mission.mission_id).filter(
                 Mission.mission_id.isnot(None)
             ).distinct().all()
 
@@ -139,14 +143,15 @@ class ProcessingAutoGenerator:
             print(f"Error getting Mission_IDs: {e}")
             return []
 
-    def _get_existing_processing_entries(self) -> Dict[int, Dict]:
+    def _get_existing_processing_entries(self, session=None) -> Dict[int, Dict]:
         """Get existing processing entries keyed by Mission_ID."""
+        session = session or db_manager.session
         try:
             Processing = db_manager.get_model('processing')
             if not Processing:
                 return {}
 
-            processing_entries = db_manager.session.query(Processing).all()
+            processing_entries = session.query(Processing).all()
 
             result = {}
             for entry in processing_entries:
@@ -186,15 +191,16 @@ class ProcessingAutoGenerator:
             print(f"Error getting existing processing Mission_IDs: {e}")
             return []
 
-    def _create_processing_entry(self, mission_id: int):
+    def _create_processing_entry(self, mission_id: int, session=None):
         """Create a new processing entry for the given Mission_ID."""
+        session = session or db_manager.session
         try:
             Processing = db_manager.get_model('processing')
             if not Processing:
                 raise RuntimeError("Processing model not found")
 
             # Get mission details for auto-population
-            mission_details = self._get_mission_details(mission_id)
+            mission_details = self._get_mission_details(mission_id, session)
             if not mission_details:
                 print(f"Warning: No mission details found for Mission_ID {mission_id}")
                 return
@@ -214,26 +220,27 @@ class ProcessingAutoGenerator:
 
             # Handle column names with special characters
             processing_entry = Processing(**processing_data)
-            db_manager.session.add(processing_entry)
+            session.add(processing_entry)
 
         except Exception as e:
             print(f"Error creating processing entry for Mission_ID {mission_id}: {e}")
             raise
 
-    def _update_processing_entry(self, mission_id: int, existing_entry: Dict):
+    def _update_processing_entry(self, mission_id: int, existing_entry: Dict, session=None):
         """Update an existing processing entry with current mission data."""
+        session = session or db_manager.session
         try:
             Processing = db_manager.get_model('processing')
             if not Processing:
                 return
 
             # Get current mission details
-            mission_details = self._get_mission_details(mission_id)
+            mission_details = self._get_mission_details(mission_id, session)
             if not mission_details:
                 return
 
             # Update the processing entry
-            processing_entry = db_manager.session.query(Processing).filter_by(
+            processing_entry = session.query(Processing).filter_by(
                 Process_ID=existing_entry['id']
             ).first()
 
@@ -264,8 +271,9 @@ class ProcessingAutoGenerator:
         except Exception as e:
             print(f"Error removing processing entry for Mission_ID {mission_id}: {e}")
 
-    def _get_mission_details(self, mission_id: int) -> Optional[Dict]:
+    def _get_mission_details(self, mission_id: int, session=None) -> Optional[Dict]:
         """Get mission details for a given Mission_ID."""
+        session = session or db_manager.session
         try:
             Mission = db_manager.get_model('missions')
             Sites = db_manager.get_model('sites')
@@ -274,7 +282,7 @@ class ProcessingAutoGenerator:
                 return None
 
             # Get one mission with this Mission_ID
-            mission = db_manager.session.query(Mission).filter_by(mission_id=mission_id).first()
+            mission = session.query(Mission).filter_by(mission_id=mission_id).first()
             if not mission:
                 return None
 
@@ -282,7 +290,7 @@ class ProcessingAutoGenerator:
             site_id = None
             if Sites and mission.site:
                 # Try to find site by name or location
-                site = db_manager.session.query(Sites).filter(
+                site = session.query(Sites).filter(
                     (Sites.name == mission.site) | (Sites.location == mission.site)
                 ).first()
                 if site:
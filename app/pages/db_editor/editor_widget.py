@@ -733,6 +733,7 @@ class DBEditorWidget(QWidget):
                 except (ValueError, TypeError):
                     pass
             session.commit()
+            db_manager.emit_table_updated(self.current_table_name)  # Notify other components of the edited rows
             QMessageBox.information(self, "Success", "Changes saved to database.")
         except Exception as e:
             session.rollback()
@@ -775,6 +776,7 @@ class DBEditorWidget(QWidget):
                     obj_to_delete = session.query(TableClass).filter_by(**{primary_key_column: pk_value}).one()
                     session.delete(obj_to_delete)
                 session.commit()
+                db_manager.emit_table_updated(self.current_table_name)  # Notify other components of the deleted rows
                 QMessageBox.information(self, "Success",
                                         f"Deleted {len(rows_to_delete_from_db)} row(s) from the database.")
             except Exception as e:
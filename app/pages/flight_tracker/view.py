@@ -1,13 +1,20 @@
 import os
+import re
+import functools
+import operator
+from collections import defaultdict, deque, namedtuple
 from datetime import datetime
+from enum import IntEnum
 
-from PyQt5.QtCore import Qt, QSize, QDate
+from PyQt5.QtCore import Qt, QSize, QDate, QTimer, QThread, QAbstractTableModel, QModelIndex, pyqtSignal
 from PyQt5.QtGui import QIcon, QColor, QPixmap, QKeySequence
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QToolBar, QAction,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTableView, QPushButton, QToolBar, QAction,
     QLineEdit, QLabel, QSizePolicy, QComboBox, QPlainTextEdit, QDateEdit, QCheckBox, QScrollArea, QGridLayout,
     QMessageBox, QSplitter, QAbstractItemView
 )
+from sqlalchemy import String, delete, func, insert, select
+from sqlalchemy.orm import Session
 
 from app.database.manager import db_manager
 from app.logic.metar_service import metar_service, MetarWorker, get_metar_for_mission
@@ -16,7 +23,415 @@ from app.logic.mission_grouping_service import mission_grouping_service
 
 TEMP_ID_PREFIX = "NEW_"
 
+# Correct path assuming 'resources' is at the project root, sibling to 'app'
+ICON_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'resources', 'icons'))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_icon(icon_name):
+    """Load a toolbar icon once; missing files give an empty icon."""
+    full_icon_path = os.path.join(ICON_DIR, icon_name)
+    if os.path.exists(full_icon_path):
+        return QIcon(full_icon_path)
+    return QIcon()
+
+# Standalone 4-letter token in upper-cased site text (typical ICAO format)
+_ICAO_RE = re.compile(r'(?<!\S)([A-Z]{4})(?!\S)')
+# First run of digits, used to sort ID-like columns numerically
+_DIGITS_RE = re.compile(r'\d+')
+
+MISSION_HEADERS = [
+    "ID", "Mission ID", "Date", "Platform", "Chassis", "Customer", "Site",
+    "Altitude (m)", "Speed (m/s)", "Spacing (m)", "Sky", "Wind (kts)", "Battery", "Filesize (GB)",
+    "Test?", "HW Issues", "Operator Issues", "SW Issues", "Outcome", "Comments", "Raw METAR"
+]
+
+
+class Col(IntEnum):
+    """Mission table column indices, matching MISSION_HEADERS."""
+    ID = 0
+    MISSION_ID = 1
+    DATE = 2
+    PLATFORM = 3
+    CHASSIS = 4
+    CUSTOMER = 5
+    SITE = 6
+    ALTITUDE = 7
+    SPEED = 8
+    SPACING = 9
+    SKY = 10
+    WIND = 11
+    BATTERY = 12
+    FILESIZE = 13
+    TEST = 14
+    ISSUES_HW = 15
+    ISSUES_OPERATOR = 16
+    ISSUES_SW = 17
+    OUTCOME = 18
+    COMMENTS = 19
+    RAW_METAR = 20
+
+
+# Fixed column widths in pixels; measuring every cell on each reload is too slow
+COL_WIDTHS = {
+    Col.ID: 60, Col.MISSION_ID: 80, Col.DATE: 90, Col.PLATFORM: 100, Col.CHASSIS: 90,
+    Col.CUSTOMER: 110, Col.SITE: 110, Col.ALTITUDE: 90, Col.SPEED: 90, Col.SPACING: 90,
+    Col.SKY: 110, Col.WIND: 80, Col.BATTERY: 80, Col.FILESIZE: 100, Col.TEST: 60,
+    Col.ISSUES_HW: 150, Col.ISSUES_OPERATOR: 150, Col.ISSUES_SW: 150, Col.OUTCOME: 110,
+    Col.COMMENTS: 200, Col.RAW_METAR: 250,
+}
+
+
+# missions table columns, in table column order
+MISSION_COLUMNS = (
+    "id", "mission_id", "date", "platform", "chassis", "customer", "site",
+    "altitude_m", "speed_m_s", "spacing_m", "sky_conditions", "wind_knots", "battery",
+    "filesize_gb", "is_test", "issues_hw", "issues_operator",
+    "issues_sw", "outcome", "comments", "raw_metar"
+)
+
+
+# One undoable cell edit; rows are identified by ID so undo still finds them after a sort
+EditRecord = namedtuple('EditRecord', 'db_id column old_value new_value')
+
+
+def _float_or_none(text):
+    """Numeric cell text as a float; blank or unparseable text becomes None."""
+    try:
+        return float(text) if text else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _date_or_none(text):
+    """'YYYY-MM-DD' cell text as a date; blank text becomes None, malformed text raises ValueError."""
+    return datetime.strptime(text, '%Y-%m-%d').date() if text else None
+
+
+def _yes_to_bool(text):
+    return str(text).lower() == 'yes'
+
+
+# Converters from cell text to column values; columns not listed keep the text
+_COLUMN_CONVERTERS = {
+    "date": _date_or_none,
+    "altitude_m": _float_or_none,
+    "speed_m_s": _float_or_none,
+    "spacing_m": _float_or_none,
+    "wind_knots": _float_or_none,
+    "filesize_gb": _float_or_none,
+    "is_test": _yes_to_bool,
+}
+
+# Column index -> (missions attribute, cell text converter), built once for the save paths
+MISSION_COL_SCHEMA = tuple((name, _COLUMN_CONVERTERS.get(name, str)) for name in MISSION_COLUMNS)
+
+
+def _mission_raw_values(m):
+    """Raw column values of a mission ORM row, in table column order."""
+    return tuple(getattr(m, name) for name in MISSION_COLUMNS)
+
+
+def _mission_to_row(raw):
+    """Render raw mission values (see MISSION_COLUMNS) into display strings."""
+    values = list(raw)
+    date_value = values[Col.DATE]
+    if date_value:
+        if hasattr(date_value, 'strftime'):
+            values[Col.DATE] = date_value.strftime('%Y-%m-%d')
+        else:
+            values[Col.DATE] = str(date_value)
+    values[Col.TEST] = "Yes" if values[Col.TEST] else "No"
+    return tuple(str(val or "") for val in values)
+
+
+class MissionLoadWorker(QThread):
+    """
+    Worker thread that queries the missions table and renders the table rows,
+    keeping the query and per-row string conversion off the GUI thread.
+    """
+    loaded = pyqtSignal(list, dict)  # rendered rows, refreshed row cache
+    error = pyqtSignal(str)
+
+    def __init__(self, mission_model, bind, row_cache, parent=None):
+        super().__init__(parent)
+        self.mission_model = mission_model
+        self.bind = bind
+        self.row_cache = row_cache
+
+    def run(self):
+        # The GUI thread owns db_manager.session, so query through a private session
+        session = Session(bind=self.bind)
+        try:
+            # Display-only load: plain column tuples, no ORM identity map or instrumented attributes
+            columns = [getattr(self.mission_model, name) for name in MISSION_COLUMNS]
+            # Format dates in SQL as 'YYYY-MM-DD' text rather than parsing a datetime per row
+            # and calling strftime on it; values SQLite can't parse are passed through as-is
+            date_column = columns[Col.DATE]
+            columns[Col.DATE] = func.coalesce(func.date(date_column), date_column, type_=String).label(date_column.key)
+            stmt = select(*columns)
+            rows = []
+            row_cache = {}
+            for result_row in session.execute(stmt).yield_per(1000):
+                # Reuse the rendered strings unless the stored values changed since the last load
+                raw = tuple(result_row)
+                cached = self.row_cache.get(raw[0])
+                if cached is None or cached[0] != raw:
+                    cached = (raw, _mission_to_row(raw))
+                row_cache[raw[0]] = cached
+                rows.append(list(cached[1]))
+            self.loaded.emit(rows, row_cache)
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            session.close()
+
+
+class ProcessingGenerationWorker(QThread):
+    """
+    Worker thread that creates processing entries for newly assigned Mission_IDs,
+    so saving a mission does not wait on the batch job.
+    """
+    generated = pyqtSignal(str)  # generation summary
+    error = pyqtSignal(str)
+
+    def __init__(self, bind, parent=None):
+        super().__init__(parent)
+        self.bind = bind
+
+    def run(self):
+        from app.logic.processing_auto_generator import processing_auto_generator
+        session = Session(bind=self.bind)
+        try:
+            results = processing_auto_generator.generate_processing_entries(force_update=False, session=session)
+            self.generated.emit(results.get('summary', 'No summary'))
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            session.close()
+
+
+EDITED_CELL_COLOR = QColor("#d08770")
+
+
+class MissionTableModel(QAbstractTableModel):
+    """
+    Table model backing the Flight Tracker mission grid.
+    Rows are kept as lists of display strings, so the view only pulls the cells it paints.
+    Unsaved cell edits are tracked here too, so they follow their rows through sorts.
+    """
+    cell_edited = pyqtSignal(int, int, str)  # row, column, old value (user edits only)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Full column set from the start, so rows can be added before the first load completes
+        self._headers = list(MISSION_HEADERS)
+        self._rows = []
+        self._dirty = {}  # (row, col) -> edited text awaiting save
+        self._temp_rows = {}  # temp ID of an unsaved row -> row
+        self._is_temp = []  # per row: True while the row exists only in the table
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        if role == Qt.BackgroundRole:
+            return EDITED_CELL_COLOR if (index.row(), index.column()) in self._dirty else None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == Col.ID:
+            # Assigned by the database (or a temp ID); save ignores edits to it
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        old_value = self._rows[row][col]
+        new_value = "" if value is None else str(value)
+        if new_value == old_value:
+            return False
+        self._rows[row][col] = new_value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.cell_edited.emit(row, col, old_value)
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows in place; ID and Mission ID columns sort numerically."""
+        if not 0 <= column < len(self._headers):
+            return
+
+        if column in [0, 1]:  # ID column (index 0) and Mission ID column (index 1)
+            # Custom sort for ID/Mission ID - numerical sort on the first number in the cell
+            # (handles temp IDs like "NEW_123" and values like "Mission 123" or just "123")
+            def numerical_key(row):
+                match = _DIGITS_RE.search(row[column])
+                return int(match.group()) if match else 0  # Default for non-numeric
+            key = numerical_key
+        else:
+            # Default string sort for other columns
+            key = lambda row: row[column]
+
+        self.layoutAboutToBeChanged.emit()
+        # Compute each row's key once, then sort the (key, old position) pairs on the key alone
+        # so ties keep their current order
+        decorated = sorted([(key(values), i) for i, values in enumerate(self._rows)],
+                           key=operator.itemgetter(0), reverse=(order == Qt.DescendingOrder))
+        order_map = [i for _, i in decorated]
+        new_position = {old: new for new, old in enumerate(order_map)}
+        self._rows = [self._rows[i] for i in order_map]
+        self._is_temp = [self._is_temp[i] for i in order_map]
+        # Keep pending edits and the temp ID index attached to the rows they belong to
+        self._dirty = {(new_position[r], c): value for (r, c), value in self._dirty.items()}
+        self._temp_rows = {temp_id: new_position[r] for temp_id, r in self._temp_rows.items()}
+        # Move persistent indexes (selection, current cell) along with their rows
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_position[index.row()], index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def reset_rows(self, headers, rows):
+        """Replace the whole table contents in one model reset."""
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._rows = rows
+        self._is_temp = [False] * len(rows)
+        self._dirty.clear()
+        self._temp_rows.clear()
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._is_temp = []
+        self._dirty.clear()
+        self._temp_rows.clear()
+        self.endResetModel()
+
+    def append_row(self, values):
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(list(values))
+        temp_id = str(values[0]).strip(' *')
+        is_temp = temp_id.startswith(TEMP_ID_PREFIX)
+        self._is_temp.append(is_temp)
+        if is_temp:
+            self._temp_rows[temp_id] = row
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row):
+        self.remove_rows([row])
+
+    def remove_rows(self, rows):
+        """Remove the given rows, one beginRemoveRows per contiguous block (last block first)."""
+        rows = sorted(set(rows), reverse=True)
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            count = last - first + 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            del self._is_temp[first:last + 1]
+            self._dirty = {(r - count if r > last else r, c): value
+                           for (r, c), value in self._dirty.items() if not first <= r <= last}
+            self._temp_rows = {temp_id: (r - count if r > last else r)
+                               for temp_id, r in self._temp_rows.items() if not first <= r <= last}
+            self.endRemoveRows()
+
+    def update_row(self, row, values):
+        """Replace one row's contents and drop its pending edits."""
+        self._rows[row] = list(values)
+        self._is_temp[row] = str(values[0]).startswith(TEMP_ID_PREFIX)
+        self._dirty = {key: value for key, value in self._dirty.items() if key[0] != row}
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+
+    def row_for_id(self, id_text):
+        """Row index whose ID cell (ignoring the edit marker) matches id_text, or -1."""
+        id_text = str(id_text)
+        if id_text.startswith(TEMP_ID_PREFIX):
+            row = self._temp_rows.get(id_text, -1)
+            # The entry is stale once the row has been saved and shows its real ID
+            if row != -1 and self._rows[row][0].strip(' *') != id_text:
+                return -1
+            return row
+        for row, values in enumerate(self._rows):
+            if values[0].strip(' *') == id_text:
+                return row
+        return -1
+
+    def is_temp_row(self, row):
+        """Whether the row is a new row that has not been saved yet."""
+        return self._is_temp[row]
+
+    def cell_text(self, row, col):
+        return self._rows[row][col]
+
+    def row_values(self, row):
+        """A copy of one row's cell texts."""
+        return list(self._rows[row])
+
+    def set_cell_text(self, row, col, text):
+        """Programmatic cell update; does not count as a user edit."""
+        self._rows[row][col] = text
+        if col == Col.ID:
+            # A saved row shows its real ID from here on
+            self._is_temp[row] = text.startswith(TEMP_ID_PREFIX)
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+
+    @property
+    def dirty_cells(self):
+        """Pending edits, (row, col) -> text."""
+        return self._dirty
+
+    def mark_dirty(self, row, col, value):
+        """Record an unsaved edit and highlight the cell."""
+        self._dirty[(row, col)] = value
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+
+    def clear_dirty(self, row, col):
+        """Forget an unsaved edit and restore the default background."""
+        if self._dirty.pop((row, col), None) is not None:
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+
+    def clear_all_dirty(self):
+        self._dirty.clear()
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, len(self._headers) - 1),
+                                  [Qt.BackgroundRole])
+
 class FlightTrackerWidget(QWidget):
+    UNDO_LIMIT = 500  # Maximum number of cell edits kept for undo/redo
+
+    # Value readers for the editor form widgets, keyed by exact widget type
+    _TEXT_GETTERS = {
+        QLineEdit: QLineEdit.text,
+        QComboBox: QComboBox.currentText,
+        QPlainTextEdit: QPlainTextEdit.toPlainText,
+        QDateEdit: lambda widget: widget.date().toPyDate(),
+        QCheckBox: QCheckBox.isChecked,
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.Mission = None
@@ -27,16 +442,36 @@ class FlightTrackerWidget(QWidget):
         self.is_redoing = False
 
         # --- Edit Tracking ---
-        self.edited_cells = {}
-        self.undo_stack = []
-        self.redo_stack = []
-        self.current_edit_original_value = None
+        self.undo_stack = deque(maxlen=self.UNDO_LIMIT)  # EditRecord entries
+        self.redo_stack = deque(maxlen=self.UNDO_LIMIT)
         self.current_selected_mission_id = None
-        self.original_table_data = {}  # Added to track original data for reverting colors
+        self._form_loaded_id = None  # Row ID currently shown in the editor form, None once it may be stale
         self.unsaved_rows = {} # New set to track unsaved rows by their temporary ID
+        self._next_temp_number = 0  # Suffix of the next temp ID; only ever grows, so IDs never repeat
+        self._row_cache = {}  # mission id -> (raw values, rendered strings)
+        self._load_worker = None  # Most recent MissionLoadWorker; only its results are applied
+        self._load_workers = set()  # Every MissionLoadWorker still running, superseded ones included
+        self._kept_new_rows = []  # (cell texts, {col: edited text}) of unsaved rows to restore after a reload
+        self._generation_worker = None  # Running ProcessingGenerationWorker, one at a time
+        self._generation_pending = False  # Another generation pass was requested while one was running
+        self._last_icao = None  # Station code of the most recent METAR fetch
+        self._headers = list(MISSION_HEADERS)  # Table header labels, built once
+
+        # Coalesce bursts of connection_set / systems_updated into a single reload
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(50)
+        self._reload_timer.timeout.connect(self.load_missions)
+        # Likewise for platforms_updated / systems_updated refreshing the dropdowns
+        self._dropdown_timer = QTimer(self)
+        self._dropdown_timer.setSingleShot(True)
+        self._dropdown_timer.setInterval(50)
+        self._dropdown_timer.timeout.connect(self.populate_dropdowns)
 
         self.setup_ui()
-        db_manager.connection_set.connect(self.load_missions)
+        db_manager.connection_set.connect(self._reload_timer.start)
+        # Embedded tabs get no closeEvent when the main window closes, so also stop workers on quit
+        QApplication.instance().aboutToQuit.connect(self._wait_for_workers)
         self.load_missions() # Initial load
 
     def setup_ui(self):
@@ -51,7 +486,9 @@ class FlightTrackerWidget(QWidget):
         self.create_toolbar()
         left_layout.addWidget(self.toolbar)
 
-        self.missionTable = QTableWidget()
+        self.missionModel = MissionTableModel(self)
+        self.missionTable = QTableView()
+        self.missionTable.setModel(self.missionModel)
         self.missionTable.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked)
         self.missionTable.setAlternatingRowColors(True)
         self.missionTable.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -80,22 +517,14 @@ class FlightTrackerWidget(QWidget):
         main_layout.addWidget(splitter)
 
         # --- Connect Signals ---
-        self.missionTable.cellPressed.connect(self.cell_pressed_for_edit)
-        self.missionTable.cellChanged.connect(self.cell_was_edited)
-        self.missionTable.cellClicked.connect(self.load_mission_to_form)
+        self.missionModel.cell_edited.connect(self.cell_was_edited)
+        self.missionTable.clicked.connect(self._on_table_clicked)
 
     def create_toolbar(self):
         self.toolbar = QToolBar("Main Toolbar")
-        # Correct path assuming 'resources' is at the project root, sibling to 'app'
-        base_dir = os.path.dirname(__file__)
-        icon_path = os.path.abspath(os.path.join(base_dir, '..', '..', 'resources', 'icons'))
 
         def create_action(text, icon_name, shortcut=None, connect_to=None):
-            icon = QIcon()
-            full_icon_path = os.path.join(icon_path, icon_name)
-            if os.path.exists(full_icon_path):
-                icon = QIcon(full_icon_path)
-            action = QAction(icon, text, self)
+            action = QAction(_load_icon(icon_name), text, self)
             if shortcut:
                 action.setShortcut(shortcut)
             if connect_to:
@@ -234,6 +663,37 @@ class FlightTrackerWidget(QWidget):
 
         self.editor_scroll_area.setWidget(self.editor_widget)
 
+        # Form widgets reset by clear_form, collected once now that the form is built
+        self._clearable_line_edits = self.editor_widget.findChildren(QLineEdit)
+        self._clearable_text_edits = self.editor_widget.findChildren(QPlainTextEdit)
+        self._clearable_combos = self.editor_widget.findChildren(QComboBox)
+        self._clearable_checks = self.editor_widget.findChildren(QCheckBox)
+
+        # Form setter per table column (None for columns without one), used when loading an unsaved row
+        setters = {
+            Col.MISSION_ID: self.mission_id_input.setText,
+            Col.DATE: lambda text: self.dateInput.setDate(QDate.fromString(text, 'yyyy-MM-dd') if text else QDate.currentDate()),
+            Col.PLATFORM: self.platformInput.setCurrentText,
+            Col.CHASSIS: self.chassisInput.setCurrentText,
+            Col.CUSTOMER: self.customerInput.setText,
+            Col.SITE: self.siteInput.setText,
+            Col.ALTITUDE: self.altitudeInput.setText,
+            Col.SPEED: self.speedInput.setText,
+            Col.SPACING: self.spacingInput.setText,
+            Col.SKY: self._set_sky,
+            Col.WIND: self.windInput.setText,
+            Col.BATTERY: self.batteryInput.setCurrentText,
+            Col.FILESIZE: self.filesizeInput.setText,
+            Col.TEST: lambda text: self.isTestInput.setChecked(text.lower() == 'yes'),
+            Col.ISSUES_HW: lambda text: self._set_combo(self.issuesHwInput, text),
+            Col.ISSUES_OPERATOR: lambda text: self._set_combo(self.issuesOperatorInput, text),
+            Col.ISSUES_SW: self.issuesSwInput.setText,
+            Col.OUTCOME: lambda text: self._set_combo(self.outcomeInput, text),
+            Col.COMMENTS: self.commentsInput.setPlainText,
+            Col.RAW_METAR: self.rawMetarInput.setPlainText,
+        }
+        self._form_setters = [setters.get(col) for col in Col]
+
         # Connect form buttons
         self.updateMissionButton.clicked.connect(self.update_mission)
         self.saveNewMissionButton.clicked.connect(self.save_new_mission)
@@ -244,9 +704,9 @@ class FlightTrackerWidget(QWidget):
         self.platformInput.currentTextChanged.connect(self.update_battery_dropdown)
 
         # Connect to database manager signals for real-time updates
-        db_manager.platforms_updated.connect(self.populate_dropdowns)
-        db_manager.systems_updated.connect(self.populate_dropdowns)
-        db_manager.systems_updated.connect(self.load_missions)
+        db_manager.platforms_updated.connect(self._dropdown_timer.start)
+        db_manager.systems_updated.connect(self._dropdown_timer.start)
+        db_manager.systems_updated.connect(self._reload_timer.start)
 
         # Populate dropdowns
         self.populate_dropdowns()
@@ -254,83 +714,106 @@ class FlightTrackerWidget(QWidget):
     def load_missions(self):
         if not db_manager.session:
             self.setEnabled(False)
-            self.missionTable.setRowCount(0)
+            self.missionModel.clear()
             QMessageBox.warning(self, "Database Error", "No database connection available.")
             return
 
         self.Mission = db_manager.get_model('missions')
         if not self.Mission:
             self.setEnabled(False)
-            self.missionTable.setRowCount(0)
+            self.missionModel.clear()
             QMessageBox.critical(self, "Database Error", "'missions' table not found in the database.")
             return
 
         self.setEnabled(True)
+        # The loaded rows replace the table, so edits made in the meantime would be lost
+        self._set_editing_enabled(False)
+
+        # Any load still in flight is superseded; its results are dropped in _on_missions_loaded
+        worker = MissionLoadWorker(self.Mission, db_manager.session.get_bind(), self._row_cache, self)
+        worker.loaded.connect(self._on_missions_loaded)
+        worker.error.connect(self._on_missions_load_error)
+        worker.finished.connect(self._on_load_worker_finished)
+        worker.finished.connect(worker.deleteLater)
+        self._load_worker = worker
+        self._load_workers.add(worker)
+        worker.start()
+
+    def _on_missions_loaded(self, rows, row_cache):
+        """Apply rows produced by MissionLoadWorker to the table."""
+        if self.sender() is not self._load_worker:
+            return
+        self._load_worker = None
+
         self.updating_table = True
-        self.edited_cells.clear()
         self.undo_stack.clear()
         self.redo_stack.clear()
         self.unsaved_rows.clear()
-        self.original_table_data.clear()
         self.clear_form()
 
-        self.missionTable.setRowCount(0)
-        headers = [
-            "ID", "Mission ID", "Date", "Platform", "Chassis", "Customer", "Site",
-            "Altitude (m)", "Speed (m/s)", "Spacing (m)", "Sky", "Wind (kts)", "Battery", "Filesize (GB)",
-            "Test?", "HW Issues", "Operator Issues", "SW Issues", "Outcome", "Comments", "Raw METAR"
-        ]
-        self.missionTable.setColumnCount(len(headers))
-        self.missionTable.setHorizontalHeaderLabels(headers)
-
-        missions = db_manager.session.query(self.Mission).all()
-        for row_idx, m in enumerate(missions):
-            self.missionTable.insertRow(row_idx)
-            date_value = ""
-            if m.date:
-                if hasattr(m.date, 'strftime'):
-                    date_value = m.date.strftime('%Y-%m-%d')
-                else:
-                    date_value = str(m.date)
-            values = [
-                m.id, m.mission_id, date_value, m.platform, m.chassis, m.customer, m.site,
-                m.altitude_m, m.speed_m_s, m.spacing_m, m.sky_conditions, m.wind_knots, m.battery,
-                m.filesize_gb, "Yes" if m.is_test else "No", m.issues_hw, m.issues_operator,
-                m.issues_sw, m.outcome, m.comments, m.raw_metar
-            ]
-            for col_idx, val in enumerate(values):
-                item = QTableWidgetItem(str(val or ""))
-                self.missionTable.setItem(row_idx, col_idx, item)
-
-            self.original_table_data[m.id] = {header: str(values[col_idx] or "") for col_idx, header in enumerate(headers)}
-
-        self.missionTable.resizeColumnsToContents()
+        self._row_cache = row_cache
+
+        # Repaint once after the reset and column sizing rather than in between
+        self.missionTable.setUpdatesEnabled(False)
+        try:
+            self.missionModel.reset_rows(self._headers, rows)
+            for col, width in COL_WIDTHS.items():
+                self.missionTable.setColumnWidth(col, width)
+            # New rows a save could not insert outlive the reload that save started
+            for values, edits in self._kept_new_rows:
+                row = self.missionModel.append_row(values)
+                self.unsaved_rows[values[Col.ID].strip(' *')] = True
+                for col, text in edits.items():
+                    self.missionModel.mark_dirty(row, col, text)
+            self._kept_new_rows = []
+        finally:
+            self.missionTable.setUpdatesEnabled(True)
         self.updating_table = False
+        self._set_editing_enabled(True)
+
+    def _on_load_worker_finished(self):
+        self._load_workers.discard(self.sender())
+
+    def _on_missions_load_error(self, error_message):
+        if self.sender() is not self._load_worker:
+            return
+        self._load_worker = None
+        self._kept_new_rows = []  # Nothing was replaced, so the kept rows are still in the table
+        self._set_editing_enabled(True)
+        QMessageBox.critical(self, "Database Error", f"Failed to load missions: {error_message}")
+
+    def _set_editing_enabled(self, enabled):
+        """Allow or block table edits, new rows and mission saves, e.g. while a load is in flight."""
+        self.missionTable.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked if enabled
+            else QAbstractItemView.NoEditTriggers)
+        for action in (self.save_action, self.delete_action, self.create_row_action,
+                       self.undo_action, self.redo_action):
+            action.setEnabled(enabled)
+        self.updateMissionButton.setEnabled(enabled)
+        self.saveNewMissionButton.setEnabled(enabled)
 
     def get_text(self, widget):
-        if isinstance(widget, QLineEdit):
-            return widget.text()
-        elif isinstance(widget, QComboBox):
-            return widget.currentText()
-        elif isinstance(widget, QPlainTextEdit):
-            return widget.toPlainText()
-        elif isinstance(widget, QDateEdit):
-            return widget.date().toPyDate()
-        elif isinstance(widget, QCheckBox):
-            return widget.isChecked()
-        return ""
+        getter = self._TEXT_GETTERS.get(type(widget))
+        return getter(widget) if getter else ""
+
+    def _on_table_clicked(self, index):
+        self.load_mission_to_form(index.row(), index.column())
 
     def load_mission_to_form(self, row, column):
+        id_text = self.missionModel.cell_text(row, 0)
+        db_id_text = id_text.strip(' *')
+        # Clicking again inside the row already shown in the form needs no reload
+        if db_id_text and db_id_text == self._form_loaded_id:
+            return
+
         # Clear the form first to prevent data carryover
         self.clear_form()
         
-        id_item = self.missionTable.item(row, 0)
-        if not id_item or not id_item.text():
+        if not id_text:
             return
 
-        db_id_text = id_item.text().strip(' *')
-        is_new_row = db_id_text.startswith(TEMP_ID_PREFIX)
-        headers = [self.missionTable.horizontalHeaderItem(c).text() for c in range(self.missionTable.columnCount())]
+        is_new_row = self.missionModel.is_temp_row(row)
 
         # For new rows, only populate the form if there's actual data in the row
         if is_new_row:
@@ -339,51 +822,14 @@ class FlightTrackerWidget(QWidget):
             self.updateMissionButton.hide()
             
             # Only populate if there's data in the row
-            has_data = any(self.missionTable.item(row, c) is not None and self.missionTable.item(row, c).text() 
-                          for c in range(1, self.missionTable.columnCount()))
+            has_data = any(self.missionModel.cell_text(row, c)
+                          for c in range(1, self.missionModel.columnCount()))
             
             if has_data:
-                for col, header in enumerate(headers):
-                    item = self.missionTable.item(row, col)
-                    text = item.text() if item else ""
-                    if header == "Mission ID": self.mission_id_input.setText(text)
-                    elif header == "Date": 
-                        self.dateInput.setDate(QDate.fromString(text, 'yyyy-MM-dd') if text else QDate.currentDate())
-                    elif header == "Platform": self.platformInput.setCurrentText(text)
-                    elif header == "Chassis": self.chassisInput.setCurrentText(text)
-                    elif header == "Customer": self.customerInput.setText(text)
-                    elif header == "Site": self.siteInput.setText(text)
-                    elif header == "Altitude (m)": self.altitudeInput.setText(text)
-                    elif header == "Speed (m/s)": self.speedInput.setText(text)
-                    elif header == "Spacing (m)": self.spacingInput.setText(text)
-                    elif header == "Sky": 
-                        index = self.skyInput.findText(text, Qt.MatchFixedString)
-                        self.skyInput.setCurrentIndex(index if index >= 0 else 0)
-                    elif header == "Wind (kts)": self.windInput.setText(text)
-                    elif header == "Battery": self.batteryInput.setCurrentText(text)
-                    elif header == "Filesize (GB)": self.filesizeInput.setText(text)
-                    elif header == "Test?": self.isTestInput.setChecked(text.lower() == 'yes')
-                    elif header == "HW Issues":
-                        index = self.issuesHwInput.findText(text, Qt.MatchFixedString)
-                        if index >= 0:
-                            self.issuesHwInput.setCurrentIndex(index)
-                        else:
-                            self.issuesHwInput.setCurrentText(text)
-                    elif header == "Operator Issues":
-                        index = self.issuesOperatorInput.findText(text, Qt.MatchFixedString)
-                        if index >= 0:
-                            self.issuesOperatorInput.setCurrentIndex(index)
-                        else:
-                            self.issuesOperatorInput.setCurrentText(text)
-                    elif header == "SW Issues": self.issuesSwInput.setText(text)
-                    elif header == "Outcome":
-                        index = self.outcomeInput.findText(text, Qt.MatchFixedString)
-                        if index >= 0:
-                            self.outcomeInput.setCurrentIndex(index)
-                        else:
-                            self.outcomeInput.setCurrentText(text)
-                    elif header == "Comments": self.commentsInput.setPlainText(text)
-                    elif header == "Raw METAR": self.rawMetarInput.setPlainText(text)
+                for col, setter in enumerate(self._form_setters):
+                    if setter:
+                        setter(self.missionModel.cell_text(row, col))
+            self._form_loaded_id = db_id_text
         else:
             # Handle existing mission
             try:
@@ -399,19 +845,11 @@ class FlightTrackerWidget(QWidget):
                 # Set platform and chassis with proper QComboBox handling
                 platform = str(mission.platform or '')
                 if platform:
-                    index = self.platformInput.findText(platform, Qt.MatchFixedString)
-                    if index >= 0:
-                        self.platformInput.setCurrentIndex(index)
-                    else:
-                        self.platformInput.setCurrentText(platform)
+                    self._set_combo(self.platformInput, platform)
 
                 chassis = str(mission.chassis or '')
                 if chassis:
-                    index = self.chassisInput.findText(chassis, Qt.MatchFixedString)
-                    if index >= 0:
-                        self.chassisInput.setCurrentIndex(index)
-                    else:
-                        self.chassisInput.setCurrentText(chassis)
+                    self._set_combo(self.chassisInput, chassis)
                 self.customerInput.setText(str(mission.customer or ''))
                 self.siteInput.setText(str(mission.site or ''))
                 self.altitudeInput.setText(str(mission.altitude_m) if mission.altitude_m is not None else '')
@@ -421,49 +859,45 @@ class FlightTrackerWidget(QWidget):
                 # Set battery with proper QComboBox handling
                 battery = str(mission.battery or '')
                 if battery:
-                    index = self.batteryInput.findText(battery, Qt.MatchFixedString)
-                    if index >= 0:
-                        self.batteryInput.setCurrentIndex(index)
-                    else:
-                        self.batteryInput.setCurrentText(battery)
+                    self._set_combo(self.batteryInput, battery)
                 self.filesizeInput.setText(str(mission.filesize_gb) if mission.filesize_gb is not None else '')
-                index = self.skyInput.findText(mission.sky_conditions or "", Qt.MatchFixedString)
-                self.skyInput.setCurrentIndex(index if index >= 0 else 0)
+                self._set_sky(mission.sky_conditions or "")
                 self.isTestInput.setChecked(mission.is_test or False)
                 # Set dropdown values with fallbacks to text input if not in list
                 hw_issues = str(mission.issues_hw or '')
                 if hw_issues:
-                    index = self.issuesHwInput.findText(hw_issues, Qt.MatchFixedString)
-                    if index >= 0:
-                        self.issuesHwInput.setCurrentIndex(index)
-                    else:
-                        self.issuesHwInput.setCurrentText(hw_issues)
+                    self._set_combo(self.issuesHwInput, hw_issues)
 
                 operator_issues = str(mission.issues_operator or '')
                 if operator_issues:
-                    index = self.issuesOperatorInput.findText(operator_issues, Qt.MatchFixedString)
-                    if index >= 0:
-                        self.issuesOperatorInput.setCurrentIndex(index)
-                    else:
-                        self.issuesOperatorInput.setCurrentText(operator_issues)
+                    self._set_combo(self.issuesOperatorInput, operator_issues)
 
                 outcome = str(mission.outcome or '')
                 if outcome:
-                    index = self.outcomeInput.findText(outcome, Qt.MatchFixedString)
-                    if index >= 0:
-                        self.outcomeInput.setCurrentIndex(index)
-                    else:
-                        self.outcomeInput.setCurrentText(outcome)
+                    self._set_combo(self.outcomeInput, outcome)
 
                 self.issuesSwInput.setText(str(mission.issues_sw or ''))
                 self.commentsInput.setPlainText(str(mission.comments or ''))
                 self.rawMetarInput.setPlainText(str(mission.raw_metar or ''))
                 self.updateMissionButton.show()
                 self.saveNewMissionButton.hide()
+                self._form_loaded_id = db_id_text
             except (ValueError, Exception) as e:
                 QMessageBox.warning(self, "Error", f"Failed to load mission: {e}")
                 self.clear_form()
 
+    def _set_combo(self, combo, text):
+        """Select text in a combo box, falling back to free text if it is not an item."""
+        index = combo.findText(text, Qt.MatchFixedString)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+        else:
+            combo.setCurrentText(text)
+
+    def _set_sky(self, text):
+        index = self.skyInput.findText(text, Qt.MatchFixedString)
+        self.skyInput.setCurrentIndex(index if index >= 0 else 0)
+
     def update_mission(self):
         if not self.current_selected_mission_id:
             QMessageBox.warning(self, "No Mission Selected", "Please select a mission to update.")
@@ -495,10 +929,13 @@ class FlightTrackerWidget(QWidget):
                 "raw_metar": self.get_text(self.rawMetarInput) or None
             }
 
+            selected_id = self.current_selected_mission_id
+            mission = None
             if is_new_row:
-                new_mission = self.Mission(**mission_data)
-                db_manager.session.add(new_mission)
+                mission = self.Mission(**mission_data)
+                db_manager.session.add(mission)
                 db_manager.session.commit()
+                db_manager.missions_updated.emit()  # Notify other components of mission changes
                 QMessageBox.information(self, "Success", "New mission saved successfully!")
             else:
                 mission = db_manager.session.query(self.Mission).filter_by(id=self.current_selected_mission_id).first()
@@ -506,10 +943,12 @@ class FlightTrackerWidget(QWidget):
                     for key, value in mission_data.items():
                         setattr(mission, key, value)
                     db_manager.session.commit()
+                    db_manager.missions_updated.emit()  # Notify other components of mission changes
                     QMessageBox.information(self, "Success", f"Mission ID {mission.mission_id} updated successfully!")
 
             self.clear_form()
-            self.load_missions()
+            if mission:
+                self._refresh_mission_row(mission, selected_id)
 
         except ValueError as e:
             db_manager.session.rollback()
@@ -519,6 +958,7 @@ class FlightTrackerWidget(QWidget):
             QMessageBox.critical(self, "Error", f"An unexpected error occurred: {e}")
 
     def save_new_mission(self):
+        selected_id = self.current_selected_mission_id
         try:
             # Don't include mission_id in the data - it will be auto-assigned
             mission_data = {
@@ -559,13 +999,13 @@ class FlightTrackerWidget(QWidget):
                     self.mission_id_input.setText(str(assigned_mission_id))
 
                 db_manager.session.commit()
+                db_manager.missions_updated.emit()  # Notify other components of mission changes
 
-                # Auto-generate processing entry
-                from app.logic.processing_auto_generator import processing_auto_generator
+                # Auto-generate processing entry in the background
                 if assigned_mission_id:
-                    processing_results = processing_auto_generator.generate_processing_entries(force_update=False)
-                    print(f"Processing entry generation: {processing_results.get('summary', 'No summary')}")
+                    self._start_processing_generation()
 
+                self._apply_mission_id_assignments(assignments)
                 QMessageBox.information(self, "Success",
                     f"New mission saved successfully!\nAssigned Mission_ID: {assigned_mission_id}")
 
@@ -573,11 +1013,12 @@ class FlightTrackerWidget(QWidget):
                 print(f"Mission_ID assignment failed: {grouping_error}")
                 # Still commit the mission even if grouping fails
                 db_manager.session.commit()
+                db_manager.missions_updated.emit()  # Notify other components of mission changes
                 QMessageBox.information(self, "Success",
                     "New mission saved successfully!\n(Note: Mission_ID assignment failed - will be assigned later)")
 
             self.clear_form()
-            self.load_missions()
+            self._refresh_mission_row(new_mission, selected_id)
 
         except ValueError as e:
             db_manager.session.rollback()
@@ -586,31 +1027,92 @@ class FlightTrackerWidget(QWidget):
             db_manager.session.rollback()
             QMessageBox.critical(self, "Error", f"An unexpected error occurred: {e}")
 
+    def _start_processing_generation(self):
+        # Two passes running at once would both see a mission as missing its entry and
+        # insert it twice; each pass covers every mission, so queue at most one rerun
+        if self._generation_worker is not None:
+            self._generation_pending = True
+            return
+        worker = ProcessingGenerationWorker(db_manager.session.get_bind(), self)
+        worker.generated.connect(self._on_processing_generated)
+        worker.error.connect(lambda error: print(f"Processing entry generation failed: {error}"))
+        worker.finished.connect(self._on_processing_generation_finished)
+        worker.finished.connect(worker.deleteLater)
+        self._generation_worker = worker
+        worker.start()
+
+    def _on_processing_generated(self, summary):
+        print(f"Processing entry generation: {summary}")
+        db_manager.processing_updated.emit()  # Notify other components of processing changes
+
+    def _on_processing_generation_finished(self):
+        self._generation_worker = None
+        if self._generation_pending:
+            self._generation_pending = False
+            self._start_processing_generation()
+
+    def _wait_for_workers(self):
+        """Block until background workers finish so no QThread is destroyed while running."""
+        self._generation_pending = False
+        for worker in (*self._load_workers, self._generation_worker):
+            if worker is not None and worker.isRunning():
+                worker.wait()
+
+    def closeEvent(self, event):
+        """Wait for background workers before the widget goes away."""
+        self._wait_for_workers()
+        event.accept()
+
+    def _refresh_mission_row(self, mission, previous_id=None):
+        """
+        Show a just-committed mission in the table without reloading every row.
+        previous_id is the ID the row was shown under (a temp ID for unsaved rows).
+        """
+        raw = _mission_raw_values(mission)
+        rendered = _mission_to_row(raw)
+        self._row_cache[mission.id] = (raw, rendered)
+
+        row = self.missionModel.row_for_id(previous_id) if previous_id is not None else -1
+        if row == -1:
+            row = self.missionModel.row_for_id(mission.id)
+        if row == -1:
+            self.missionModel.append_row(rendered)
+            return
+
+        if str(previous_id).startswith(TEMP_ID_PREFIX):
+            self.unsaved_rows.pop(previous_id, None)
+        # The committed values replace any pending grid edits on this row
+        self.missionModel.update_row(row, rendered)
+
+    def _apply_mission_id_assignments(self, assignments):
+        """Reflect Mission_IDs assigned by the grouping service in the table."""
+        for row in range(self.missionModel.rowCount()):
+            id_text = self.missionModel.cell_text(row, Col.ID).strip(' *')
+            if not id_text.isdigit():
+                continue
+            assigned = assignments.get(int(id_text))
+            if assigned is not None and self.missionModel.cell_text(row, Col.MISSION_ID) != str(assigned):
+                self.missionModel.set_cell_text(row, Col.MISSION_ID, str(assigned))
+
     def _is_row_has_data(self, row_idx):
         """Check if a row has any non-empty data cells (excluding ID column)."""
-        for col in range(1, self.missionTable.columnCount()):
-            item = self.missionTable.item(row_idx, col)
-            if item and item.text().strip():
+        for col in range(1, self.missionModel.columnCount()):
+            if self.missionModel.cell_text(row_idx, col).strip():
                 return True
         return False
 
     def save_edits(self):
-        if not self.edited_cells and not self.unsaved_rows:
+        if not self.missionModel.dirty_cells and not self.unsaved_rows:
             QMessageBox.information(self, "No Changes", "There are no pending changes to save.")
             return
 
         try:
             saved_count = 0
             
-            # Handle new rows first
+            # Handle new rows first, collecting them for the insert below
+            new_rows = []  # (temp_id, row_idx, mission_data)
             for temp_id in list(self.unsaved_rows.keys()):
-                row_idx = -1
-                for i in range(self.missionTable.rowCount()):
-                    item = self.missionTable.item(i, 0)
-                    if item and item.text() == temp_id:
-                        row_idx = i
-                        break
-                
+                row_idx = self.missionModel.row_for_id(temp_id)
                 if row_idx == -1:
                     continue
 
@@ -618,108 +1120,111 @@ class FlightTrackerWidget(QWidget):
                 if not self._is_row_has_data(row_idx):
                     continue
 
-                headers = [self.missionTable.horizontalHeaderItem(c).text() 
-                         for c in range(self.missionTable.columnCount())]
+                # Every column but ID, so all rows share the same keys and a blank cell is NULL
                 mission_data = {}
                 
-                for col, header in enumerate(headers):
-                    if header == 'ID':
-                        continue
-                        
-                    item = self.missionTable.item(row_idx, col)
-                    if not item:
+                for col, (col_name, convert) in enumerate(MISSION_COL_SCHEMA):
+                    if col == Col.ID:
                         continue
                         
-                    text = item.text().strip()
-                    col_name = header.lower().replace(' ', '_').replace('(', '').replace(')', '')
-                    
-                    # Handle different data types
+                    text = self.missionModel.cell_text(row_idx, col).strip()
                     if not text:
                         mission_data[col_name] = None
-                    elif header == 'Date':
-                        try:
-                            mission_data[col_name] = datetime.strptime(text, '%Y-%m-%d').date()
-                        except ValueError:
-                            mission_data[col_name] = None
-                    elif header in ['Altitude (m)', 'Speed (m/s)', 'Spacing (m)', 'Wind (kts)', 'Filesize (GB)']:
-                        try:
-                            mission_data[col_name] = float(text) if text else None
-                        except ValueError:
-                            mission_data[col_name] = None
-                    elif header == 'Test?':
-                        mission_data['is_test'] = text.lower() == 'yes'
-                    else:
-                        mission_data[col_name] = text
-
-                try:
-                    new_mission = self.Mission(**mission_data)
-                    db_manager.session.add(new_mission)
-                    db_manager.session.flush()  # Get the ID but don't commit yet
-
-                    # Assign Mission_ID using the grouping service
+                        continue
                     try:
-                        assignments = mission_grouping_service.assign_mission_ids(reevaluate_existing=False)
-                        assigned_mission_id = assignments.get(new_mission.id)
-
-                        if assigned_mission_id:
-                            new_mission.mission_id = assigned_mission_id
-                            # Update the table to show the assigned Mission_ID
-                            self.missionTable.item(row_idx, 1).setText(str(assigned_mission_id))
-
-                        saved_count += 1
+                        mission_data[col_name] = convert(text)
+                    except ValueError:
+                        mission_data[col_name] = None
 
-                        # Update the temp ID to real ID
-                        self.missionTable.item(row_idx, 0).setText(str(new_mission.id))
+                new_rows.append((temp_id, row_idx, mission_data))
 
-                    except Exception as grouping_error:
-                        print(f"Mission_ID assignment failed for new mission: {grouping_error}")
-                        # Still count as saved but without Mission_ID
-                        saved_count += 1
-                        self.missionTable.item(row_idx, 0).setText(str(new_mission.id))
+            new_mission_id_to_row_idx = {}
+            failed_new_rows = []  # (row_idx, error) of new rows the database rejected
+            if new_rows:
+                # One INSERT ... RETURNING per row, so each row gets its own id back rather than
+                # relying on the order AUTOINCREMENT hands ids out in. Every row has the same
+                # keys, so the statement is compiled once and reused.
+                stmt = insert(self.Mission).returning(self.Mission.id)
+                for temp_id, row_idx, mission_data in new_rows:
+                    try:
+                        # A savepoint per row, so a bad row rolls back only itself
+                        with db_manager.session.begin_nested():
+                            new_id = db_manager.session.execute(stmt, mission_data).scalar_one()
+                    except Exception as e:
+                        failed_new_rows.append((row_idx, str(e)))
+                        continue
+                    new_mission_id_to_row_idx[new_id] = row_idx
+                    self.unsaved_rows.pop(temp_id, None)
+                    self.missionModel.set_cell_text(row_idx, 0, str(new_id))
+                saved_count += len(new_mission_id_to_row_idx)
 
-                except Exception as e:
-                    db_manager.session.rollback()
+                if failed_new_rows:
                     QMessageBox.warning(self, "Save Error",
-                                     f"Failed to save row {row_idx + 1}: {str(e)}")
-
-            # Handle cell edits for existing missions
-            for (row, col), new_value in self.edited_cells.items():
-                db_id_item = self.missionTable.item(row, 0)
-                if not db_id_item or db_id_item.text().startswith(TEMP_ID_PREFIX):
+                                     f"Failed to save {len(failed_new_rows)} of {len(new_rows)} new row(s); "
+                                     f"they are kept in the table for correction.\n"
+                                     f"First error: {failed_new_rows[0][1]}")
+            new_row_indexes = {row_idx for _, row_idx, _ in new_rows}
+
+            # Handle cell edits for existing missions, grouped per mission for one bulk UPDATE
+            updates_by_id = defaultdict(dict)
+            for (row, col), new_value in self.missionModel.dirty_cells.items():
+                if self.missionModel.is_temp_row(row) or col == Col.ID:
+                    continue
+                db_id_text = self.missionModel.cell_text(row, 0)
+                if not db_id_text:
+                    continue
+                if row in new_row_indexes:
+                    # Already written by the insert above
                     continue
                 
                 try:
-                    db_id = int(db_id_item.text().strip(' *'))
-                    column_name = self.missionTable.horizontalHeaderItem(col).text().lower().replace(' ', '_').replace('(', '').replace(')', '')
-                    mission = db_manager.session.query(self.Mission).filter_by(id=db_id).first()
-                    
-                    if mission:
-                        # Convert value to appropriate type
-                        if column_name == 'date':
-                            new_value = datetime.strptime(new_value, '%Y-%m-%d').date() if new_value else None
-                        elif column_name in ['altitude_m', 'speed_m_s', 'spacing_m', 'wind_knots', 'filesize_gb']:
-                            try:
-                                new_value = float(new_value) if new_value else None
-                            except (ValueError, TypeError):
-                                new_value = None
-                        elif column_name == 'is_test':
-                            new_value = str(new_value).lower() == 'yes'
-                                
-                        setattr(mission, column_name, new_value)
-                        saved_count += 1
+                    db_id = int(db_id_text.strip(' *'))
+                    column_name, convert = MISSION_COL_SCHEMA[col]
+                    updates_by_id[db_id][column_name] = convert(new_value)
                         
                 except Exception as e:
-                    db_manager.session.rollback()
                     QMessageBox.warning(self, "Update Error", 
                                      f"Failed to update cell at row {row + 1}, column {col + 1}: {str(e)}")
+
+            if updates_by_id:
+                try:
+                    mappings = [{**changes, 'id': db_id} for db_id, changes in updates_by_id.items()]
+                    with db_manager.session.begin_nested():
+                        db_manager.session.bulk_update_mappings(self.Mission, mappings)
+                    saved_count += sum(len(changes) for changes in updates_by_id.values())
+                except Exception as e:
+                    QMessageBox.warning(self, "Update Error",
+                                     f"Failed to update {len(updates_by_id)} mission(s): {str(e)}")
             
             if saved_count > 0:
                 db_manager.session.commit()
+                db_manager.missions_updated.emit()  # Notify other components of mission changes
+
+                if new_mission_id_to_row_idx:
+                    # Assign Mission_IDs once for the whole batch. This runs after the commit
+                    # because the grouping service commits, or rolls back, the session itself.
+                    try:
+                        assignments = mission_grouping_service.assign_mission_ids(reevaluate_existing=False)
+                        for new_id, row_idx in new_mission_id_to_row_idx.items():
+                            assigned_mission_id = assignments.get(new_id)
+                            if assigned_mission_id:
+                                # Update the table to show the assigned Mission_ID
+                                self.missionModel.set_cell_text(row_idx, 1, str(assigned_mission_id))
+
+                    except Exception as grouping_error:
+                        # Still count as saved but without Mission_ID
+                        print(f"Mission_ID assignment failed for new missions: {grouping_error}")
+
                 QMessageBox.information(self, "Success", f"Successfully saved {saved_count} changes.")
-                self.edited_cells.clear()
-                self.unsaved_rows.clear()
+                # Rows the database rejected are put back after the reload, edits and temp IDs intact
+                self._kept_new_rows = [
+                    (self.missionModel.row_values(row_idx),
+                     {col: text for (row, col), text in self.missionModel.dirty_cells.items() if row == row_idx})
+                    for row_idx, _ in failed_new_rows
+                ]
+                self.missionModel.clear_all_dirty()
                 self.load_missions()  # Refresh the table
-            else:
+            elif not failed_new_rows:
                 QMessageBox.information(self, "No Valid Changes", "No valid changes were found to save.")
                 
         except Exception as e:
@@ -727,87 +1232,115 @@ class FlightTrackerWidget(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to save changes: {e}")
 
     def delete_selected(self):
-        selected_rows = sorted(list(set(index.row() for index in self.missionTable.selectedIndexes())), reverse=True)
+        selected_rows = sorted(list(set(index.row() for index in self.missionTable.selectionModel().selectedIndexes())), reverse=True)
         if not selected_rows:
             return
 
         reply = QMessageBox.question(self, "Confirm Deletion", "Delete selected mission(s)?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             try:
+                ids_to_delete = []
                 for row in selected_rows:
-                    id_item = self.missionTable.item(row, 0)
-                    if id_item.text().startswith(TEMP_ID_PREFIX):
-                        self.missionTable.removeRow(row)
+                    id_text = self.missionModel.cell_text(row, 0)
+                    if self.missionModel.is_temp_row(row):
+                        self.unsaved_rows.pop(id_text.strip(' *'), None)
                     else:
-                        db_id = int(id_item.text().strip(' *'))
-                        mission = db_manager.session.query(self.Mission).filter_by(id=db_id).first()
-                        if mission:
-                            db_manager.session.delete(mission)
-                db_manager.session.commit()
-                self.load_missions()
+                        ids_to_delete.append(int(id_text.strip(' *')))
+
+                if ids_to_delete:
+                    # One DELETE ... WHERE id IN (...) for the whole selection
+                    db_manager.session.execute(delete(self.Mission).where(self.Mission.id.in_(ids_to_delete)))
+                    db_manager.session.commit()
+                    db_manager.missions_updated.emit()  # Notify other components of mission changes
+                    for db_id in ids_to_delete:
+                        self._row_cache.pop(db_id, None)
+
+                # Drop the rows locally instead of reloading, which would also discard unsaved rows.
+                # A scattered selection is removed block by block, so repaint once at the end.
+                self.missionTable.setUpdatesEnabled(False)
+                try:
+                    self.missionModel.remove_rows(selected_rows)
+                finally:
+                    self.missionTable.setUpdatesEnabled(True)
+                self.clear_form()
             except Exception as e:
                 db_manager.session.rollback()
                 QMessageBox.critical(self, "Error", f"Failed to delete: {e}")
 
     def create_new_empty_row(self):
-        row_count = self.missionTable.rowCount()
-        self.missionTable.insertRow(row_count)
-        temp_id = f"{TEMP_ID_PREFIX}{row_count}"
-        self.missionTable.setItem(row_count, 0, QTableWidgetItem(temp_id))
-        self.missionTable.setItem(row_count, 2, QTableWidgetItem(datetime.now().strftime('%Y-%m-%d')))
+        # Not derived from rowCount(): rows are deleted locally, so a count-based ID could repeat
+        temp_id = f"{TEMP_ID_PREFIX}{self._next_temp_number}"
+        self._next_temp_number += 1
+        row_values = [""] * self.missionModel.columnCount()
+        row_values[Col.ID] = temp_id
+        row_values[Col.DATE] = datetime.now().strftime('%Y-%m-%d')
+        self.missionModel.append_row(row_values)
         self.unsaved_rows[temp_id] = True
         self.missionTable.scrollToBottom()
 
-    def cell_pressed_for_edit(self, row, column):
-        if not self.updating_table:
-            item = self.missionTable.item(row, column)
-            self.current_edit_original_value = item.text() if item else ""
-
-    def cell_was_edited(self, row, column):
+    def cell_was_edited(self, row, column, old_value):
         if self.updating_table or self.is_undoing or self.is_redoing: return
 
-        current_item = self.missionTable.item(row, column)
-        new_value = current_item.text() if current_item else ""
-
-        if new_value == self.current_edit_original_value: return
-
-        db_id_item = self.missionTable.item(row, 0)
-        db_id = db_id_item.text()
-        column_name = self.missionTable.horizontalHeaderItem(column).text()
+        self._form_loaded_id = None
+        new_value = self.missionModel.cell_text(row, column)
+        db_id = self.missionModel.cell_text(row, 0)
 
-        edit_record = {
-            "db_id": db_id, "row": row, "column": column,
-            "old_value": self.current_edit_original_value, "new_value": new_value
-        }
-        self.undo_stack.append(edit_record)
+        self.undo_stack.append(EditRecord(db_id.strip(' *'), column, old_value, new_value))
         self.redo_stack.clear()
 
-        self.edited_cells[(row, column)] = new_value
-        current_item.setBackground(QColor("#d08770"))
+        if new_value == self._original_cell_text(db_id.strip(' *'), column):
+            # Edited back to the loaded value, so there is nothing to save for this cell
+            self.missionModel.clear_dirty(row, column)
+            return
+
+        self.missionModel.mark_dirty(row, column, new_value)
         if not db_id.endswith(' *'):
-            db_id_item.setText(f"{db_id} *")
+            self.missionModel.set_cell_text(row, 0, f"{db_id} *")
+
+    def _original_cell_text(self, db_id, column):
+        """Text a cell showed when its mission was loaded; "" for unsaved NEW_ rows or any other non-numeric ID."""
+        if not db_id.isdigit():
+            return ""
+        cached = self._row_cache.get(int(db_id))
+        return cached[1][column] if cached else ""
 
     def undo_last_edit(self):
         if not self.undo_stack: return
+        self._form_loaded_id = None
         self.is_undoing = True
         last_edit = self.undo_stack.pop()
         self.redo_stack.append(last_edit)
 
-        row, col = last_edit['row'], last_edit['column']
-        self.missionTable.item(row, col).setText(last_edit['old_value'])
-        self.edited_cells.pop((row, col), None)
-        # Add logic to check if row has other edits before removing color/asterisk
+        row = self.missionModel.row_for_id(last_edit.db_id)
+        if row == -1:
+            self.is_undoing = False
+            return
+        col = last_edit.column
+        self.missionModel.setData(self.missionModel.index(row, col), last_edit.old_value)
+        if last_edit.old_value == self._original_cell_text(last_edit.db_id, col):
+            self.missionModel.clear_dirty(row, col)
+        else:
+            self.missionModel.mark_dirty(row, col, last_edit.old_value)
+        # Add logic to check if row has other edits before removing asterisk
         self.is_undoing = False
 
     def redo_last_edit(self):
         if not self.redo_stack: return
+        self._form_loaded_id = None
         self.is_redoing = True
         last_undone_edit = self.redo_stack.pop()
         self.undo_stack.append(last_undone_edit)
 
-        row, col = last_undone_edit['row'], last_undone_edit['column']
-        self.missionTable.item(row, col).setText(last_undone_edit['new_value'])
-        self.edited_cells[(row, col)] = last_undone_edit['new_value']
+        row = self.missionModel.row_for_id(last_undone_edit.db_id)
+        if row == -1:
+            self.is_redoing = False
+            return
+        col = last_undone_edit.column
+        self.missionModel.setData(self.missionModel.index(row, col), last_undone_edit.new_value)
+        if last_undone_edit.new_value == self._original_cell_text(last_undone_edit.db_id, col):
+            self.missionModel.clear_dirty(row, col)
+        else:
+            self.missionModel.mark_dirty(row, col, last_undone_edit.new_value)
         self.is_redoing = False
 
     def toggle_editor_visibility(self):
@@ -816,16 +1349,17 @@ class FlightTrackerWidget(QWidget):
         self.editor_scroll_area.setVisible(not is_visible)
 
     def clear_form(self):
-        for widget in self.editor_widget.findChildren(QLineEdit):
+        for widget in self._clearable_line_edits:
             widget.clear()
-        for widget in self.editor_widget.findChildren(QPlainTextEdit):
+        for widget in self._clearable_text_edits:
             widget.clear()
-        for widget in self.editor_widget.findChildren(QComboBox):
+        for widget in self._clearable_combos:
             widget.setCurrentIndex(0)
-        for widget in self.editor_widget.findChildren(QCheckBox):
+        for widget in self._clearable_checks:
             widget.setChecked(False)
         self.dateInput.setDate(QDate.currentDate())
         self.current_selected_mission_id = None
+        self._form_loaded_id = None
         self.updateMissionButton.hide()
         self.saveNewMissionButton.show()
 
@@ -886,6 +1420,7 @@ class FlightTrackerWidget(QWidget):
 
         # Extract station code for pre-filling
         station_code = self._extract_airport_code(site) if site else ""
+        self._last_icao = station_code
 
         # Convert date to datetime for the dialog (use current time if date only)
         from datetime import datetime
@@ -907,18 +1442,15 @@ class FlightTrackerWidget(QWidget):
         if selected_metar:
             self.rawMetarInput.setPlainText(selected_metar)
 
-    def _extract_airport_code(self, site_text):
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _extract_airport_code(site_text):
         """Extract ICAO airport code from site text."""
         if not site_text:
             return None
 
-        # Look for 4-letter uppercase codes (typical ICAO format)
-        words = site_text.upper().split()
-        for word in words:
-            if len(word) == 4 and word.isalpha():
-                return word
-
-        return None
+        match = _ICAO_RE.search(site_text.upper())
+        return match.group(1) if match else None
 
     def _on_metar_fetched(self, metar_data):
         """Handle successful METAR data fetch."""
@@ -926,7 +1458,7 @@ class FlightTrackerWidget(QWidget):
         self.fetchMetarButton.setText("Fetch METAR")
         self.fetchMetarButton.setEnabled(True)
         QMessageBox.information(self, "METAR Fetched",
-                              f"METAR data retrieved successfully for {self._extract_airport_code(self.siteInput.text())}")
+                              f"METAR data retrieved successfully for {self._last_icao}")
 
     def custom_sort(self, column):
         """Custom sort function that handles numerical sorting for Mission ID column."""
@@ -937,54 +1469,12 @@ class FlightTrackerWidget(QWidget):
             self.current_sort_column = column
             self.current_sort_order = Qt.AscendingOrder
 
-        # Get all rows data
-        rows_data = []
-        for row in range(self.missionTable.rowCount()):
-            row_data = []
-            for col in range(self.missionTable.columnCount()):
-                item = self.missionTable.item(row, col)
-                row_data.append(item.text() if item else "")
-            rows_data.append(row_data)
-
-        # Sort the data
-        if column in [0, 1]:  # ID column (index 0) and Mission ID column (index 1)
-            # Custom sort for ID/Mission ID - numerical sort
-            def numerical_key(row):
-                value = row[column]
-                try:
-                    # For ID column, handle temporary IDs like "NEW_123"
-                    if column == 0 and value.startswith(TEMP_ID_PREFIX):
-                        # Extract number from temp ID
-                        import re
-                        numbers = re.findall(r'\d+', value)
-                        if numbers:
-                            return int(numbers[0])
-                        else:
-                            return 0
-                    else:
-                        # Try to extract number from value (handles cases like "Mission 123" or just "123")
-                        import re
-                        numbers = re.findall(r'\d+', value)
-                        if numbers:
-                            return int(numbers[0])  # Use first number found
-                        else:
-                            return 0  # Default for non-numeric
-                except (ValueError, TypeError):
-                    return 0
-
-            rows_data.sort(key=numerical_key, reverse=(self.current_sort_order == Qt.DescendingOrder))
-        else:
-            # Default string sort for other columns
-            rows_data.sort(key=lambda row: row[column], reverse=(self.current_sort_order == Qt.DescendingOrder))
-
-        # Update the table with sorted data
-        self.updating_table = True
-        for row_idx, row_data in enumerate(rows_data):
-            for col_idx, cell_data in enumerate(row_data):
-                item = self.missionTable.item(row_idx, col_idx)
-                if item:
-                    item.setText(cell_data)
-        self.updating_table = False
+        # Repaint once after the rows are reordered
+        self.missionTable.setUpdatesEnabled(False)
+        try:
+            self.missionModel.sort(column, self.current_sort_order)
+        finally:
+            self.missionTable.setUpdatesEnabled(True)
 
         # Update sort indicator
         self.missionTable.horizontalHeader().setSortIndicator(column, self.current_sort_order)
@@ -1,16 +1,21 @@
+import functools
 import os
+import re
 import sys
 import subprocess
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
-from PyQt5.QtCore import Qt, QSize, QDate, pyqtSignal
-from PyQt5.QtGui import QIcon, QColor, QPixmap, QFont
+from PyQt5.QtCore import (
+    Qt, QSize, QDate, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex, QPersistentModelIndex,
+    QSortFilterProxyModel, QStringListModel
+)
+from PyQt5.QtGui import QIcon, QColor, QPixmap, QFont, QBrush, QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QToolBar, QAction,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QTableView, QPushButton, QToolBar, QAction,
     QLineEdit, QLabel, QSizePolicy, QComboBox, QPlainTextEdit, QDateEdit, QCheckBox, QScrollArea,
     QSplitter, QAbstractItemView, QGroupBox, QFormLayout, QTextEdit, QFrame, QMessageBox, QGridLayout,
-    QDialog, QDialogButtonBox, QMenu, QStyledItemDelegate, QFileDialog
+    QDialog, QDialogButtonBox, QMenu, QStyledItemDelegate, QFileDialog, QStyle, QStatusBar, QHeaderView
 )
 from PyQt5.QtCore import QEvent
 
@@ -18,58 +23,519 @@ from app.database.manager import db_manager
 from sqlalchemy import text
 
 TEMP_ID_PREFIX = "NEW_"
+STATUS_MESSAGE_TIMEOUT = 5000  # Milliseconds a status bar notice stays visible
+RESOURCES_DIR = os.path.join(os.path.dirname(__file__), "resources")
+BASE_DATA_ROOT = Path(__file__).resolve().parents[3] / "Data"  # Default data storage root, next to app/
+
+PROCESSING_HEADERS = [
+    "ID", "Name", "Chassis SN", "Processed", "QA/QC", "Mission Date",
+    "Site", "Created", "Mission ID", "Site ID", "Folder Path"
+]
+PROCESSING_PAGE_SIZE = 500  # Rows fetched from the database per page as the table scrolls
+NUMERIC_COLUMNS = (0, 8, 9)  # ID, Mission ID, Site ID
+DATE_COLUMNS = (5, 7)  # Mission Date, Created
+# Grid column -> processing table column saved from it; Mission Date and Site are display-only
+PROCESSING_COLUMN_NAMES = {
+    1: "Name", 2: "Chassis_SN", 3: "Processed", 4: "QA/QC",
+    7: "Creation Date", 8: "Mission_ID", 9: "Site_ID", 10: "Folder_Path"
+}
+GROUP_INFO_HEADERS = ["Mission ID", "Date", "Platform", "Chassis", "Customer", "Site", "Outcome"]
+GROUP_INFO_COLUMN_WIDTHS = [80, 90, 110, 110, 140, 160, 100]  # Used instead of measuring large groups
+GROUP_INFO_FIT_LIMIT = 50  # Groups up to this size have their columns fitted to the contents
+MISSION_BROWSER_HEADERS = ["Mission ID", "Date", "Platform", "Chassis", "Site"]
+MISSION_BROWSER_PAGE_SIZE = 200  # Missions fetched from the database per page as the mission browser scrolls
+MISSION_BROWSER_CELL_PADDING = 16  # Pixels added to the measured text width of a mission browser column
+
+# Built once so every page fetch reuses the same statement (and SQLAlchemy's cached compilation).
+# Processing rows only; mission dates and site names come from lookup tables loaded per refresh.
+# Pages come in the table's default order (ID, newest first), so rows fetched later append at the bottom.
+# NULLs and date formatting are handled by the database.
+PROCESSING_PAGE_QUERY = text("""
+    SELECT
+        Process_ID,
+        COALESCE(Name, ''),
+        COALESCE(Chassis_SN, ''),
+        COALESCE(Processed, ''),
+        COALESCE("QA/QC", ''),
+        COALESCE(date("Creation Date"), "Creation Date", ''),
+        Mission_ID,
+        Site_ID,
+        COALESCE(Folder_Path, '')
+    FROM processing
+    ORDER BY Process_ID DESC
+    LIMIT :limit OFFSET :offset
+""")
+MISSION_DATES_QUERY = text("SELECT id, COALESCE(date(date), date, '') FROM missions")
+SITES_QUERY = text("SELECT site_ID, name, location FROM sites")
+PROCESSING_COUNT_QUERY = text("SELECT count(*) FROM processing")
+PROCESSING_MISSION_IDS_QUERY = text("SELECT DISTINCT Mission_ID FROM processing WHERE Mission_ID IS NOT NULL")
+# The four values a processing entry's data folder is named from
+FOLDER_DETAILS_QUERY = text("""
+    SELECT p.Name, p.Chassis_SN, m.date, s.name AS site_name
+    FROM processing p
+    LEFT JOIN missions m ON p.Mission_ID = m.id
+    LEFT JOIN sites s ON p.Site_ID = s.site_ID
+    WHERE p.Process_ID = :process_id
+""")
+# Missions with their site, newest first, as listed by the mission browser.
+# Dates come back as 'YYYY-MM-DD' text; values SQLite can't parse are passed through as-is.
+MISSION_BROWSER_QUERY = text("""
+    SELECT
+        m.id,
+        COALESCE(date(m.date), m.date, '') AS date,
+        m.platform,
+        m.chassis,
+        m.site,
+        s.name as site_name,
+        s.location as site_location
+    FROM missions m
+    LEFT JOIN sites s ON m.site = s.site_ID
+    ORDER BY m.date DESC, m.id DESC
+    LIMIT :limit OFFSET :offset
+""")
+MISSION_COUNT_QUERY = text("SELECT count(*) FROM missions")
+
+MISSION_FILTER_RE = re.compile(r'Mission (\d+)')  # Mission ID in a mission filter entry
+
+EDITED_CELL_BRUSH = QBrush(QColor("#d08770"))
+# Folder path button colours, shared by every painted cell
+FOLDER_BUTTON_BACKGROUND = QColor("#e3f2fd")  # Light blue
+FOLDER_BUTTON_BORDER = QColor("#1976d2")
+FOLDER_BUTTON_TEXT = QColor("#0d47a1")
+
+# (background, foreground) colours for each status value
+STATUS_PALETTE = {
+    "processed": {
+        "Yes": ("#d4edda", "#155724"),  # Green
+        "No": ("#f8d7da", "#721c24"),  # Red
+        "Reprocess": ("#fff3cd", "#856404"),  # Yellow
+    },
+    "qa": {
+        "Approved": ("#d4edda", "#155724"),  # Green
+        "Not Approved": ("#f8d7da", "#721c24"),  # Red
+        "Needs Review": ("#cce7ff", "#004085"),  # Blue
+    },
+}
+STATUS_COLUMNS = {3: "processed", 4: "qa"}  # Processed and QA/QC table columns
+PROCESSED_OPTIONS = ["Yes", "No", "Reprocess"]  # Processed dropdown entries
+QA_OPTIONS = ["Needs Review", "Approved", "Not Approved"]  # QA/QC dropdown entries
+
+# Built once and shared by every cell and label showing a status
+STATUS_BRUSHES = {
+    (status_type, value): (QBrush(QColor(bg)), QBrush(QColor(fg)))
+    for status_type, colors in STATUS_PALETTE.items()
+    for value, (bg, fg) in colors.items()
+}
+# Card styling shared by the processing card, its group boxes and the status badges
+PROCESSING_WIDGET_QSS = """
+    QGroupBox#processingCard, QGroupBox#processingCard QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 1ex;
+    }
+    QGroupBox#processingCard::title, QGroupBox#processingCard QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QLabel#statusBadge {
+        padding: 5px;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+""" + "".join(
+    # Badge colours, selected by the label's statusType and status dynamic properties
+    f'    QLabel#statusBadge[statusType="{status_type}"][status="{value}"] {{ '
+    f'background-color: {bg}; color: {fg}; }}\n'
+    for status_type, colors in STATUS_PALETTE.items()
+    for value, (bg, fg) in colors.items()
+)
 
-# ---- Custom QTableWidgetItem classes for proper sorting ----
-class NumericTableWidgetItem(QTableWidgetItem):
-    """Table item that sorts numerically based on an integer/float value."""
-    def __init__(self, text_value: str):
-        super().__init__(text_value)
-        # Try to parse numeric sort key; fall back to string when not numeric
-        try:
-            if '.' in (text_value or ''):
-                sort_key = float(text_value)
-            else:
-                sort_key = int(text_value)
-        except (ValueError, TypeError):
-            sort_key = None
-        self.setData(Qt.UserRole, sort_key if sort_key is not None else text_value)
-
-    def __lt__(self, other):
-        if isinstance(other, QTableWidgetItem):
-            a = self.data(Qt.UserRole)
-            b = other.data(Qt.UserRole)
-            # If both numeric, compare numerically; else compare as strings
-            a_is_num = isinstance(a, (int, float))
-            b_is_num = isinstance(b, (int, float))
-            if a_is_num and b_is_num:
-                return a < b
-            return str(self.text()) < str(other.text())
-        return super().__lt__(other)
-
-class DateTableWidgetItem(QTableWidgetItem):
-    """Table item that sorts by date using YYYYMMDD integer sort key."""
-    def __init__(self, display_text: str):
-        super().__init__(display_text or "")
-        sort_key = None
-        try:
-            # Expect formats like YYYY-MM-DD
-            if display_text:
-                parts = str(display_text).split('-')
-                if len(parts) == 3:
-                    sort_key = int(parts[0]) * 10000 + int(parts[1]) * 100 + int(parts[2])
-        except Exception:
-            sort_key = None
-        self.setData(Qt.UserRole, sort_key if sort_key is not None else display_text)
-    def __lt__(self, other):
-        if isinstance(other, QTableWidgetItem):
-            a = self.data(Qt.UserRole)
-            b = other.data(Qt.UserRole)
-            a_is_num = isinstance(a, int)
-            b_is_num = isinstance(b, int)
-            if a_is_num and b_is_num:
+
+@functools.lru_cache(maxsize=1024)
+def _folder_button_text(folder_path):
+    """Folder path button caption; built once per path rather than on every repaint."""
+    return f"📁 {os.path.basename(folder_path)}" if folder_path else "📁 Set Folder"
+
+
+def _numeric_sort_key(text_value):
+    """Integer/float sort key for a numeric cell, or None when the text is not numeric."""
+    text_value = text_value.strip()
+    try:
+        return float(text_value) if '.' in text_value else int(text_value)
+    except ValueError:
+        return None
+
+
+def _date_sort_key(text_value):
+    """YYYYMMDD integer sort key for a YYYY-MM-DD cell, or None when the text is not a date."""
+    parts = text_value.split('-')
+    if len(parts) != 3:
+        return None
+    try:
+        return int(parts[0]) * 10000 + int(parts[1]) * 100 + int(parts[2])
+    except ValueError:
+        return None
+
+
+def _row_db_id(id_text):
+    """Process_ID for an ID cell's text, or None for an unsaved NEW_ row."""
+    return None if id_text.startswith(TEMP_ID_PREFIX) else int(id_text)
+
+
+def _site_display(name, location):
+    """Site column text, "Name (Location)"; empty for a site with neither."""
+    if not (name or location):
+        return ""
+    return f"{name or ''} ({location or ''})".strip()
+
+
+# Sort key builder for each column that sorts by value rather than by text
+SORT_KEY_FUNCS = {col: _numeric_sort_key for col in NUMERIC_COLUMNS}
+SORT_KEY_FUNCS.update({col: _date_sort_key for col in DATE_COLUMNS})
+
+
+class ProcessingTableModel(QAbstractTableModel):
+    """
+    Table model backing the processing grid.
+    Rows are kept as lists of display strings, so the view only pulls the cells it paints.
+    Status colours and unsaved edits are served through data() instead of being set per item.
+    Database rows arrive in pages through fetchMore() as the view scrolls.
+    Sort keys for the numeric and date columns are parsed once per cell value, not on every compare.
+    """
+    cell_edited = pyqtSignal(int, int, str)  # row, column, old value (user edits only)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = list(PROCESSING_HEADERS)
+        self._rows = []
+        self._row_ids = []  # Per-row Process_ID parsed from the ID cell, None for unsaved rows
+        self._dirty = set()  # (row, col) cells whose edited text awaits save
+        self._dirty_by_row = {}  # row -> columns of that row in _dirty
+        self._sort_keys = {col: [] for col in SORT_KEY_FUNCS}  # column -> per-row key, None if unparsable
+        self._fetch_rows = None  # callable(offset, limit) -> list of rows, or None when nothing to page
+        self._loaded = 0  # database rows fetched so far
+        self._total_count = 0  # database rows available
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole and col == 0 and self.row_is_dirty(row):
+            return f"{self._rows[row][0]} *"  # Unsaved-edit marker
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[row][col]
+        if role == Qt.BackgroundRole:
+            if (row, col) in self._dirty:
+                return EDITED_CELL_BRUSH
+            brushes = STATUS_BRUSHES.get((STATUS_COLUMNS.get(col), self._rows[row][col]))
+            return brushes[0] if brushes else None
+        if role == Qt.ForegroundRole:
+            brushes = STATUS_BRUSHES.get((STATUS_COLUMNS.get(col), self._rows[row][col]))
+            return brushes[1] if brushes else None
+        if role == Qt.UserRole:
+            # Sort key: numbers and dates compare by value, everything else by text
+            keys = self._sort_keys.get(col)
+            key = keys[row] if keys is not None else None
+            return self._rows[row][col] if key is None else key
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        old_value = self._rows[row][col]
+        new_value = "" if value is None else str(value)
+        if new_value == old_value:
+            return False
+        self._set_text(row, col, new_value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.cell_edited.emit(row, col, old_value)
+        return True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetch_rows is not None and self._loaded < self._total_count
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._append_fetched(self._fetch_rows(self._loaded, PROCESSING_PAGE_SIZE))
+
+    def fetch_all(self):
+        """Fetch all remaining database rows in one go."""
+        if self.canFetchMore():
+            self._append_fetched(self._fetch_rows(self._loaded, self._total_count - self._loaded))
+
+    def _append_fetched(self, rows):
+        if not rows:
+            # The table shrank since it was counted; stop paging
+            self._total_count = self._loaded
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._row_ids.extend(_row_db_id(values[0]) for values in rows)
+        self._extend_sort_keys(rows)
+        self._loaded += len(rows)
+        self.endInsertRows()
+
+    @property
+    def headers(self):
+        return self._headers
+
+    def reset_rows(self, rows, total_count=None, fetch_rows=None):
+        """
+        Replace the whole table contents in one model reset.
+        With fetch_rows, rows is the first page of total_count database rows and the rest are fetched on demand.
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._row_ids = [_row_db_id(values[0]) for values in rows]
+        self._dirty.clear()
+        self._dirty_by_row.clear()
+        for keys in self._sort_keys.values():
+            keys.clear()
+        self._extend_sort_keys(rows)
+        self._fetch_rows = fetch_rows
+        self._loaded = len(rows)
+        self._total_count = len(rows) if total_count is None else total_count
+        self.endResetModel()
+
+    def refresh_rows(self, rows, total_count=None, fetch_rows=None):
+        """
+        Bring the table up to date with freshly fetched rows, matched to the current ones by ID.
+        Rows that are gone are removed, new rows are inserted and changed rows emit dataChanged,
+        so the view keeps its scroll position and selection. Falls back to reset_rows when the
+        rows that remain have changed order.
+        """
+        old_ids = [values[0] for values in self._rows]
+        new_ids = [values[0] for values in rows]
+        old_id_set, new_id_set = set(old_ids), set(new_ids)
+        if not self._rows or ([pid for pid in old_ids if pid in new_id_set]
+                              != [pid for pid in new_ids if pid in old_id_set]):
+            self.reset_rows(rows, total_count, fetch_rows)
+            return
+
+        # Pending edits are dropped with the old data
+        dirty, self._dirty = self._dirty, set()
+        dirty_rows, self._dirty_by_row = self._dirty_by_row, {}
+        for row, col in dirty:
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+        for row in dirty_rows:
+            self._emit_id_changed(row)
+
+        # Remove rows missing from the new data, bottom-up in contiguous runs
+        last = len(self._rows) - 1
+        while last >= 0:
+            if old_ids[last] in new_id_set:
+                last -= 1
+                continue
+            first = last
+            while first > 0 and old_ids[first - 1] not in new_id_set:
+                first -= 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            del self._row_ids[first:last + 1]
+            for keys in self._sort_keys.values():
+                del keys[first:last + 1]
+            self.endRemoveRows()
+            last = first - 1
+
+        # The remaining rows are now in the new order, so walk both lists together
+        row = 0
+        while row < len(rows):
+            if row < len(self._rows) and self._rows[row][0] == new_ids[row]:
+                old_values, new_values = self._rows[row], rows[row]
+                changed = [col for col, (old, new) in enumerate(zip(old_values, new_values)) if old != new]
+                if changed:
+                    for col in changed:
+                        self._set_text(row, col, new_values[col])
+                    self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+                row += 1
+                continue
+            end = row
+            while end < len(rows) and new_ids[end] not in old_id_set:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._rows[row:row] = rows[row:end]
+            self._row_ids[row:row] = [_row_db_id(pid) for pid in new_ids[row:end]]
+            for col, keys in self._sort_keys.items():
+                key_func = SORT_KEY_FUNCS[col]
+                keys[row:row] = [key_func(values[col]) for values in rows[row:end]]
+            self.endInsertRows()
+            row = end
+
+        self._fetch_rows = fetch_rows
+        self._loaded = len(rows)
+        self._total_count = len(rows) if total_count is None else total_count
+
+    def clear(self):
+        self.reset_rows([])
+
+    def append_row(self, values):
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(list(values))
+        self._row_ids.append(_row_db_id(values[0]))
+        self._extend_sort_keys(self._rows[row:])
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._row_ids[row]
+        for keys in self._sort_keys.values():
+            del keys[row]
+        self._dirty = {(r - 1 if r > row else r, c) for r, c in self._dirty if r != row}
+        self._dirty_by_row = {r - 1 if r > row else r: cols for r, cols in self._dirty_by_row.items() if r != row}
+        self.endRemoveRows()
+
+    def row_for_id(self, id_text):
+        """Row index whose ID cell matches id_text, or -1."""
+        id_text = str(id_text)
+        for row, values in enumerate(self._rows):
+            if values[0] == id_text:
+                return row
+        return -1
+
+    def cell_text(self, row, col):
+        return self._rows[row][col]
+
+    def row_db_id(self, row):
+        """The row's Process_ID, or None for an unsaved row."""
+        return self._row_ids[row]
+
+    def row_values(self, row):
+        """The row's cell texts in column order; callers must not modify the list."""
+        return self._rows[row]
+
+    def row_dict(self, row):
+        """The row's cell texts keyed by header, read in one pass."""
+        return dict(zip(self._headers, self._rows[row]))
+
+    def sort_keys(self, col):
+        """Per-row parsed sort keys for a numeric or date column (None where unparsable), else None."""
+        return self._sort_keys.get(col)
+
+    def _set_text(self, row, col, text_value):
+        self._rows[row][col] = text_value
+        if col == 0:
+            self._row_ids[row] = _row_db_id(text_value)
+        if col in self._sort_keys:
+            self._sort_keys[col][row] = SORT_KEY_FUNCS[col](text_value)
+
+    def _extend_sort_keys(self, rows):
+        for col, keys in self._sort_keys.items():
+            key_func = SORT_KEY_FUNCS[col]
+            keys.extend(key_func(values[col]) for values in rows)
+
+    def set_cell_text(self, row, col, text_value):
+        """Programmatic cell update; does not count as a user edit."""
+        self._set_text(row, col, text_value)
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+
+    @property
+    def dirty_cells(self):
+        """Pending edits as a set of (row, col); the edited text is the cell's current text."""
+        return self._dirty
+
+    @property
+    def dirty_cells_by_row(self):
+        """The same pending edits grouped by row: row -> set of dirty columns."""
+        return self._dirty_by_row
+
+    def mark_dirty(self, row, col):
+        """Record an unsaved edit and highlight the cell."""
+        if (row, col) not in self._dirty:
+            self._dirty.add((row, col))
+            row_cols = self._dirty_by_row.setdefault(row, set())
+            row_cols.add(col)
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+            if len(row_cols) == 1:
+                self._emit_id_changed(row)
+
+    def row_is_dirty(self, row):
+        """Whether any cell in the row has an unsaved edit."""
+        return row in self._dirty_by_row
+
+    def clear_dirty(self, row, col):
+        """Forget an unsaved edit and restore the cell's normal background."""
+        if (row, col) in self._dirty:
+            self._dirty.discard((row, col))
+            row_cols = self._dirty_by_row[row]
+            row_cols.discard(col)
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+            if not row_cols:
+                del self._dirty_by_row[row]
+                self._emit_id_changed(row)
+
+    def _emit_id_changed(self, row):
+        """Repaint the row's ID cell, whose unsaved-edit marker follows the row's dirty state."""
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+
+class ProcessingProxyModel(QSortFilterProxyModel):
+    """
+    Sort/filter proxy for the processing grid.
+    Sorting compares the model's parsed sort keys, so numeric and date columns sort by value;
+    the status and mission filters are checked against the table model's cell texts.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._conditions = ()  # Active (column, required text) pairs
+
+    def set_filters(self, processed=None, qa=None, mission_id=None):
+        """Show only rows matching every given value; None disables that filter."""
+        # Inactive filters are dropped here, so filterAcceptsRow only checks the live ones
+        self._conditions = tuple(
+            (col, value)
+            for col, value in ((3, processed), (4, qa), (8, mission_id))
+            if value is not None
+        )
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._conditions:
+            return True
+        values = self.sourceModel().row_values(source_row)
+        return all(values[col] == value for col, value in self._conditions)
+
+    def lessThan(self, left, right):
+        # Read straight from the table model's lists rather than through data() and the Qt bindings
+        model = self.sourceModel()
+        col = left.column()
+        left_row, right_row = left.row(), right.row()
+        keys = model.sort_keys(col)
+        if keys is not None:
+            a = keys[left_row]
+            b = keys[right_row]
+            # If both keys parsed, compare them as numbers; else compare the display text
+            if a is not None and b is not None:
                 return a < b
-            return str(self.text()) < str(other.text())
-        return super().__lt__(other)
+        return model.cell_text(left_row, col) < model.cell_text(right_row, col)
 
 class ProcessingTrackerWidget(QWidget):
     def __init__(self, parent=None):
@@ -83,25 +549,36 @@ class ProcessingTrackerWidget(QWidget):
         self.is_undoing = False
         self.is_redoing = False
 
-        # Edit tracking
-        self.edited_cells = {}
+        # Edit tracking (pending cell edits live in the table model)
         self.undo_stack = []
         self.redo_stack = []
-        self.current_edit_original_value = None
         self.current_selected_processing_id = None
-        self.original_table_data = {}
-        self.unsaved_rows = {}
+        self.original_table_data = {}  # Process_ID -> tuple of the cell texts as loaded
+        self.unsaved_rows = {}  # Temp ID -> QPersistentModelIndex of a row not yet inserted into the database
+        self._next_temp_number = 0  # Suffix of the next temp ID; only ever grows, so IDs never repeat
 
         # Data caches
-        self.missions_cache = {}
         self.sites_cache = {}
+        self._mission_dates = {}  # mission id -> YYYY-MM-DD date, reloaded with the table
+        self._site_lookup = {}  # site_ID -> (name, location, Site column text), reloaded with the table
+        self._base_data_path = None  # Absolute data root, resolved on first folder open
+        self._known_folders = set()  # Data folders already known to exist
+        self._mission_browser_model = None  # Mission browser rows kept between opens, until missions or sites change
+
+        self._columns_sized = False  # Column widths are fitted to the first load only
 
         self.setup_ui()
-        db_manager.connection_set.connect(self.load_data)
+        db_manager.connection_set.connect(self._on_connection_set)
+        db_manager.missions_updated.connect(self.invalidate_mission_browser_rows)
+        db_manager.sites_updated.connect(self.invalidate_mission_browser_rows)
+        db_manager.processing_updated.connect(self._on_processing_updated)
         self.load_data()
 
     def setup_ui(self):
         """Set up the user interface with table and card views."""
+        # One stylesheet for the whole widget, parsed once; rules target widgets by object name
+        self.setStyleSheet(PROCESSING_WIDGET_QSS)
+
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         splitter = QSplitter(Qt.Horizontal)
@@ -120,7 +597,11 @@ class ProcessingTrackerWidget(QWidget):
         left_layout.addWidget(self.filters_group)
 
         # Table
-        self.processing_table = QTableWidget()
+        self.processing_model = ProcessingTableModel(self)
+        self.proxy_model = ProcessingProxyModel(self)
+        self.proxy_model.setSourceModel(self.processing_model)
+        self.processing_table = QTableView()
+        self.processing_table.setModel(self.proxy_model)
         self.processing_table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked)
         self.processing_table.setAlternatingRowColors(True)
         self.processing_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -129,51 +610,93 @@ class ProcessingTrackerWidget(QWidget):
         self.processing_table.horizontalHeader().setSortIndicatorShown(True)
         self.processing_table.horizontalHeader().setStretchLastSection(True)
         self.processing_table.verticalHeader().setVisible(False)
+        # Fit column widths to the first rows only instead of measuring every cell
+        self.processing_table.horizontalHeader().setResizeContentsPrecision(50)
         self.processing_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Custom delegate for the Folder Path column to show a button; one instance for the table's lifetime
+        self._folder_delegate = FolderPathDelegate(self.processing_table)
+        self.processing_table.setItemDelegateForColumn(10, self._folder_delegate)
+        # Dropdown editors for the status and ID columns; Qt creates and destroys the combo boxes,
+        # which all share the option models built once here and in populate_dropdown_caches
+        self._dropdown_delegates = {
+            3: DropdownDelegate(QStringListModel(PROCESSED_OPTIONS, self), parent=self.processing_table),
+            4: DropdownDelegate(QStringListModel(QA_OPTIONS, self), parent=self.processing_table),
+            8: DropdownDelegate(self.mission_combo_model, store_id=True, parent=self.processing_table),
+            9: DropdownDelegate(self.site_combo_model, store_id=True, parent=self.processing_table),
+        }
+        for col, delegate in self._dropdown_delegates.items():
+            self.processing_table.setItemDelegateForColumn(col, delegate)
         left_layout.addWidget(self.processing_table)
 
-        # Right side: Card Details View
-        self.create_card_view()
+        # Status bar for non-blocking notices (errors still use message boxes)
+        self.status_bar = QStatusBar()
+        left_layout.addWidget(self.status_bar)
+
+        # Right side: Card Details View, built on first selection (see _ensure_card_view)
+        self._card_built = False
+        self.card_placeholder = QWidget()
+        self._splitter = splitter
 
         splitter.addWidget(left_widget)
-        splitter.addWidget(self.card_scroll_area)
+        splitter.addWidget(self.card_placeholder)
         splitter.setSizes([600, 400])
 
         main_layout.addWidget(splitter)
 
         # Connect signals
-        self.processing_table.cellPressed.connect(self.cell_pressed_for_edit)
-        self.processing_table.cellChanged.connect(self.cell_was_edited)
-        self.processing_table.cellClicked.connect(self.load_processing_to_form)
-        self.processing_table.cellDoubleClicked.connect(self.handle_cell_double_click)
+        self.processing_model.cell_edited.connect(self.cell_was_edited)
+        # Sorting by a column orders every processing entry, not only the pages fetched so far
+        self.processing_table.horizontalHeader().sortIndicatorChanged.connect(self.load_all_rows)
+        self.processing_table.clicked.connect(
+            lambda index: self.load_processing_to_form(*self._source_cell(index)))
+
+    def _source_cell(self, view_index):
+        """(row, column) in the table model for an index of the sorted view."""
+        index = self.proxy_model.mapToSource(view_index)
+        return index.row(), index.column()
+
+    def _view_index(self, row, column):
+        """Index of the sorted view showing the given table model cell."""
+        return self.proxy_model.mapFromSource(self.processing_model.index(row, column))
 
     def create_toolbar(self):
         """Create the toolbar with actions."""
         self.toolbar = QToolBar("Processing Toolbar")
-
-        # Actions
-        self.refresh_action = QAction("🔄 Refresh", self)
+        self.toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        style = self.style()
+
+        # Actions use icons rather than emoji in their text, so the labels don't need emoji font shaping
+        refresh_icon_path = os.path.join(RESOURCES_DIR, "refresh.svg")
+        refresh_icon = (QIcon(refresh_icon_path) if os.path.exists(refresh_icon_path)
+                        else style.standardIcon(QStyle.SP_BrowserReload))
+        self.refresh_action = QAction(refresh_icon, "Refresh", self)
+        self.refresh_action.triggered.connect(self.invalidate_mission_browser_rows)
         self.refresh_action.triggered.connect(self.load_data)
 
-        self.save_action = QAction("💾 Save Changes", self)
+        self.save_action = QAction(style.standardIcon(QStyle.SP_DialogSaveButton), "Save Changes", self)
         self.save_action.triggered.connect(self.save_edits)
 
-        self.delete_action = QAction("🗑️ Delete Selected", self)
+        self.delete_action = QAction(style.standardIcon(QStyle.SP_TrashIcon), "Delete Selected", self)
         self.delete_action.triggered.connect(self.delete_selected)
 
+        self.load_all_action = QAction(style.standardIcon(QStyle.SP_ArrowDown), "Load All", self)
+        self.load_all_action.setToolTip("Fetch all processing entries instead of one page at a time")
+        self.load_all_action.triggered.connect(self.load_all_rows)
+
         # Manual entry creation disabled - entries are auto-generated
         # self.create_row_action = QAction("➕ New Entry", self)
         # self.create_row_action.triggered.connect(self.show_new_entry_menu)
 
-        self.undo_action = QAction("↶ Undo", self)
+        self.undo_action = QAction(style.standardIcon(QStyle.SP_ArrowBack), "Undo", self)
         self.undo_action.triggered.connect(self.undo_last_edit)
 
-        self.redo_action = QAction("↷ Redo", self)
+        self.redo_action = QAction(style.standardIcon(QStyle.SP_ArrowForward), "Redo", self)
         self.redo_action.triggered.connect(self.redo_last_edit)
 
         self.toolbar.addAction(self.refresh_action)
         self.toolbar.addAction(self.save_action)
         self.toolbar.addAction(self.delete_action)
+        self.toolbar.addAction(self.load_all_action)
         # Manual entry creation disabled - entries are auto-generated
         # self.toolbar.addAction(self.create_row_action)
         self.toolbar.addSeparator()
@@ -188,19 +711,13 @@ class ProcessingTrackerWidget(QWidget):
         # Status filters
         layout.addWidget(QLabel("Processed:"))
         self.processed_filter = QComboBox()
-        self.processed_filter.addItem("All")
-        self.processed_filter.addItem("Yes")
-        self.processed_filter.addItem("No")
-        self.processed_filter.addItem("Reprocess")
+        self.processed_filter.addItems(["All"] + PROCESSED_OPTIONS)
         self.processed_filter.currentTextChanged.connect(self.apply_filters)
         layout.addWidget(self.processed_filter)
 
         layout.addWidget(QLabel("QA/QC:"))
         self.qa_filter = QComboBox()
-        self.qa_filter.addItem("All")
-        self.qa_filter.addItem("Needs Review")
-        self.qa_filter.addItem("Approved")
-        self.qa_filter.addItem("Not Approved")
+        self.qa_filter.addItems(["All"] + QA_OPTIONS)
         self.qa_filter.currentTextChanged.connect(self.apply_filters)
         layout.addWidget(self.qa_filter)
 
@@ -216,7 +733,20 @@ class ProcessingTrackerWidget(QWidget):
         # Initialize dropdown caches
         self.mission_dropdown_cache = {}
         self.site_dropdown_cache = {}
-        self.populate_dropdown_caches()
+        self.mission_combo_model = QStandardItemModel(self)  # Shared by every mission dropdown
+        self.site_combo_model = QStandardItemModel(self)  # Shared by every site dropdown
+
+    def _ensure_card_view(self):
+        """Build the card view the first time it is needed, in place of the placeholder."""
+        if self._card_built:
+            return
+        self.create_card_view()
+        sizes = self._splitter.sizes()
+        self._splitter.replaceWidget(1, self.card_scroll_area)
+        self._splitter.setSizes(sizes)
+        self.card_placeholder.deleteLater()
+        self._card_built = True
+        self.clear_card_view()
 
     def create_card_view(self):
         """Create the card-based details view."""
@@ -244,19 +774,7 @@ class ProcessingTrackerWidget(QWidget):
     def create_processing_card(self):
         """Create the main processing information card."""
         card = QGroupBox("Processing Entry")
-        card.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        card.setObjectName("processingCard")  # Styled by PROCESSING_WIDGET_QSS
 
         layout = QVBoxLayout(card)
 
@@ -301,13 +819,8 @@ class ProcessingTrackerWidget(QWidget):
         processed_layout = QVBoxLayout()
         processed_layout.addWidget(QLabel("Processed:"))
         self.card_processed_label = QLabel("No")
-        self.card_processed_label.setStyleSheet("""
-            QLabel {
-                padding: 5px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-        """)
+        self.card_processed_label.setObjectName("statusBadge")
+        self.card_processed_label.setProperty("statusType", "processed")
         processed_layout.addWidget(self.card_processed_label)
         status_layout.addLayout(processed_layout)
 
@@ -315,13 +828,8 @@ class ProcessingTrackerWidget(QWidget):
         qa_layout = QVBoxLayout()
         qa_layout.addWidget(QLabel("QA/QC:"))
         self.card_qa_label = QLabel("Needs Review")
-        self.card_qa_label.setStyleSheet("""
-            QLabel {
-                padding: 5px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-        """)
+        self.card_qa_label.setObjectName("statusBadge")
+        self.card_qa_label.setProperty("statusType", "qa")
         qa_layout.addWidget(self.card_qa_label)
         status_layout.addLayout(qa_layout)
 
@@ -331,9 +839,12 @@ class ProcessingTrackerWidget(QWidget):
         # Notes section
         notes_group = QGroupBox("Notes")
         notes_layout = QVBoxLayout(notes_group)
-        self.card_notes_text = QTextEdit()
+        # Plain-text display: no rich-text document or undo stack needed for read-only notes
+        self.card_notes_text = QPlainTextEdit()
         self.card_notes_text.setMaximumHeight(100)
         self.card_notes_text.setReadOnly(True)
+        self.card_notes_text.setUndoRedoEnabled(False)
+        self.card_notes_text.setMaximumBlockCount(500)
         notes_layout.addWidget(self.card_notes_text)
         layout.addWidget(notes_group)
 
@@ -362,204 +873,152 @@ class ProcessingTrackerWidget(QWidget):
 
         layout.addStretch()
 
+    def _on_connection_set(self):
+        """Drop the models resolved for the previous database, then reload."""
+        self.Processing = None
+        self.Missions = None
+        self.Sites = None
+        self._mission_browser_model = None
+        self.load_data()
+
     def load_data(self):
         """Load processing data from database."""
         if not db_manager.session:
             self.setEnabled(False)
-            self.processing_table.setRowCount(0)
+            self.processing_model.clear()
             QMessageBox.warning(self, "Database Error", "No database connection available.")
             return
 
-        self.Processing = db_manager.get_model('processing')
-        self.Missions = db_manager.get_model('missions')
-        self.Sites = db_manager.get_model('sites')
+        # Resolved once per connection; _on_connection_set forgets them when the database changes
+        if self.Processing is None:
+            self.Processing = db_manager.get_model('processing')
+        if self.Missions is None:
+            self.Missions = db_manager.get_model('missions')
+        if self.Sites is None:
+            self.Sites = db_manager.get_model('sites')
 
         if not self.Processing:
             self.setEnabled(False)
-            self.processing_table.setRowCount(0)
+            self.processing_model.clear()
             QMessageBox.critical(self, "Database Error", "'processing' table not found in the database.")
             return
 
         self.setEnabled(True)
         self.updating_table = True
-        self.edited_cells.clear()
         self.undo_stack.clear()
         self.redo_stack.clear()
         self.unsaved_rows.clear()
         self.original_table_data.clear()
 
-        # Load processing data with JOINs
-        query = text("""
-            SELECT
-                p.Process_ID,
-                p.Name,
-                p.Chassis_SN,
-                p.Processed,
-                p."QA/QC",
-                p.Notes,
-                p."Creation Date",
-                p.Mission_ID,
-                p.Site_ID,
-                p.Folder_Path,
-                m.date as mission_date,
-                s.name as site_name,
-                s.location as site_location
-            FROM processing p
-            LEFT JOIN missions m ON p.Mission_ID = m.id
-            LEFT JOIN sites s ON p.Site_ID = s.site_ID
-            ORDER BY p."Creation Date" DESC
-        """)
-
-        result = db_manager.session.execute(query).fetchall()
-
-        # Set up table
-        headers = [
-            "ID", "Name", "Chassis SN", "Processed", "QA/QC", "Mission Date",
-            "Site", "Created", "Mission ID", "Site ID", "Folder Path"
-        ]
-        self.processing_table.setColumnCount(len(headers))
-        self.processing_table.setHorizontalHeaderLabels(headers)
-
-        # Set custom delegate for Folder Path column to show button
-        self.processing_table.setItemDelegateForColumn(10, FolderPathDelegate(self.processing_table))
-
-        # Set up custom sorting for Mission ID column (column 8)
-        self.processing_table.setSortingEnabled(True)
-        self.processing_table.horizontalHeader().setSortIndicatorShown(True)
-
-        # Rely on custom item types for sorting; no manual header-click rebuild needed
-
         # Temporarily disable sorting during population to avoid churn
         self.processing_table.setSortingEnabled(False)
-        self.processing_table.setRowCount(0)
-        self.missions_cache.clear()
         self.sites_cache.clear()
+        self._load_lookups()
+        self.populate_dropdown_caches()
 
-        for row_idx, row in enumerate(result):
-            self.processing_table.insertRow(row_idx)
+        # Only the first page (or as many rows as are already shown) is fetched here;
+        # the model pulls further pages as the view scrolls
+        total_count = db_manager.session.execute(PROCESSING_COUNT_QUERY).scalar() or 0
+        first_page = self._fetch_processing_page(0, max(PROCESSING_PAGE_SIZE, self.processing_model.rowCount()))
+        self.processing_table.setUpdatesEnabled(False)
+        try:
+            # Diffed against the current rows, so a refresh keeps the view's scroll position and selection
+            self.processing_model.refresh_rows(first_page, total_count, self._fetch_processing_page)
+            # Size the columns once; later refreshes keep the current (possibly user-adjusted) widths
+            if first_page and not self._columns_sized:
+                self.processing_table.resizeColumnsToContents()
+                self._columns_sized = True
+            # Re-enable sorting now that population is complete
+            self.processing_table.setSortingEnabled(True)
+        finally:
+            self.processing_table.setUpdatesEnabled(True)
+        self.updating_table = False
 
-            # Format data
-            mission_date = ""
-            if row.mission_date:
-                if hasattr(row.mission_date, 'strftime'):
-                    mission_date = row.mission_date.strftime('%Y-%m-%d')
-                else:
-                    mission_date = str(row.mission_date)
+        # Update filters
+        self.update_filters()
 
-            created_date = ""
-            if row[6]:
-                if hasattr(row[6], 'strftime'):
-                    created_date = row[6].strftime('%Y-%m-%d')
-                else:
-                    created_date = str(row[6])
-            site_display = f"{row.site_name or ''} ({row.site_location or ''})".strip()
-            if site_display == "()":
-                site_display = ""
+        # Clear card view
+        self.clear_card_view()
+
+    def _fetch_processing_page(self, offset, limit):
+        """Fetch one page of processing rows as lists of display strings, caching their originals."""
+        # Rows are consumed straight off the result instead of being collected with fetchall() first
+        result = db_manager.session.execute(PROCESSING_PAGE_QUERY, {'limit': limit, 'offset': offset})
+
+        mission_dates = self._mission_dates
+        site_lookup = self._site_lookup
+        rows = []
+        for (process_id, name, chassis_sn, processed, qa_qc, created_date, mission_id, site_id,
+             folder_path) in result:
+            mission_date = mission_dates.get(mission_id, "")
+            site_name, site_location, site_display = site_lookup.get(site_id, (None, None, ""))
 
+            # Status colours and sort keys are derived from these strings by the model
             values = [
-                row.Process_ID,
-                row.Name or "",
-                row.Chassis_SN or "",
-                row.Processed or "",
-                row[4] or "",  # QA/QC
-                mission_date,
+                str(process_id),
+                name,
+                chassis_sn,
+                processed,
+                qa_qc,
+                str(mission_date),
                 site_display,
-                created_date,
-                row.Mission_ID or "",
-                row.Site_ID or "",
-                row.Folder_Path or ""  # Folder Path
+                str(created_date),
+                str(mission_id) if mission_id else "",
+                str(site_id) if site_id else "",
+                folder_path
             ]
-
-            for col_idx, val in enumerate(values):
-                text_val = "" if val is None else str(val)
-                # Use specialized items for correct sorting
-                if col_idx in (0, 8, 9):  # ID, Mission ID, Site ID
-                    item = NumericTableWidgetItem(text_val)
-                elif col_idx in (5, 7):  # Mission Date, Created
-                    item = DateTableWidgetItem(text_val)
-                else:
-                    item = QTableWidgetItem(text_val)
-                # While updating, do not trigger edit coloring
-                self.processing_table.setItem(row_idx, col_idx, item)
-
-                # Color coding for status columns
-                if col_idx == 3:  # Processed column
-                    self.set_status_color(item, val, "processed")
-                elif col_idx == 4:  # QA/QC column
-                    self.set_status_color(item, val, "qa")
+            rows.append(values)
 
             # Store original data
-            self.original_table_data[row.Process_ID] = {header: str(values[col_idx] or "") for col_idx, header in enumerate(headers)}
+            self.original_table_data[process_id] = tuple(values)
 
-            # Cache mission and site data
-            if row.Mission_ID:
-                self.missions_cache[row.Mission_ID] = {
-                    'date': mission_date,
-                    'id': row.Mission_ID
-                }
-            if row.Site_ID:
-                self.sites_cache[row.Site_ID] = {
-                    'name': row.site_name or "",
-                    'location': row.site_location or ""
+            # Cache site data
+            if site_id:
+                self.sites_cache[site_id] = {
+                    'name': site_name or "",
+                    'location': site_location or ""
                 }
 
-        self.processing_table.resizeColumnsToContents()
-        # Re-enable sorting now that population is complete
-        self.processing_table.setSortingEnabled(True)
-        self.updating_table = False
+        return rows
 
-        # Update filters
-        self.update_filters()
+    def _load_lookups(self):
+        """Load mission dates and site names once per refresh, so page fetches need no JOINs."""
+        self._mission_dates = dict(db_manager.session.execute(MISSION_DATES_QUERY).all()) if self.Missions else {}
+        self._site_lookup = {site_id: (name, location, _site_display(name, location))
+                             for site_id, name, location in db_manager.session.execute(SITES_QUERY)} if self.Sites else {}
 
-        # Clear card view
-        self.clear_card_view()
+    def load_all_rows(self):
+        """Fetch every remaining page of processing rows at once."""
+        self.processing_model.fetch_all()
 
-    # Removed manual sorting methods; relying on QTableWidget built-in sorting with custom items
-
-    def set_status_color(self, item, value, status_type):
-        """Set color coding for status columns."""
-        if status_type == "processed":
-            if value == "Yes":
-                item.setBackground(QColor("#d4edda"))  # Light green
-                item.setForeground(QColor("#155724"))  # Dark green
-            elif value == "No":
-                item.setBackground(QColor("#f8d7da"))  # Light red
-                item.setForeground(QColor("#721c24"))  # Dark red
-            elif value == "Reprocess":
-                item.setBackground(QColor("#fff3cd"))  # Light yellow
-                item.setForeground(QColor("#856404"))  # Dark yellow
-        elif status_type == "qa":
-            if value == "Approved":
-                item.setBackground(QColor("#d4edda"))  # Light green
-                item.setForeground(QColor("#155724"))  # Dark green
-            elif value == "Not Approved":
-                item.setBackground(QColor("#f8d7da"))  # Light red
-                item.setForeground(QColor("#721c24"))  # Dark red
-            elif value == "Needs Review":
-                item.setBackground(QColor("#cce7ff"))  # Light blue
-                item.setForeground(QColor("#004085"))  # Dark blue
+    # Sorting and filtering are handled by ProcessingProxyModel; status colours by ProcessingTableModel.data()
 
     def update_filters(self):
         """Update filter dropdowns with current data."""
         # Update mission filter
         current_mission_selection = self.mission_filter.currentText()
-        self.mission_filter.clear()
-        self.mission_filter.addItem("All Missions")
 
+        # Every mission with processing entries, not only those on the pages fetched so far
         mission_options = set()
-        for mission_id, mission_data in self.missions_cache.items():
-            if mission_data['date']:
-                option = f"Mission {mission_id} ({mission_data['date']})"
-                mission_options.add(option)
+        for mission_id in db_manager.session.execute(PROCESSING_MISSION_IDS_QUERY).scalars():
+            mission_date = self._mission_dates.get(mission_id)
+            if mission_date:
+                mission_options.add(f"Mission {mission_id} ({mission_date})")
 
-        for option in sorted(mission_options):
-            self.mission_filter.addItem(option)
+        # Rebuilt silently; the filter is re-applied once below, only if the selection was lost
+        self.mission_filter.blockSignals(True)
+        self.mission_filter.clear()
+        self.mission_filter.addItem("All Missions")
+        self.mission_filter.addItems(sorted(mission_options))
 
         # Try to restore previous selection
         if current_mission_selection and current_mission_selection != "All Missions":
             index = self.mission_filter.findText(current_mission_selection)
             if index >= 0:
                 self.mission_filter.setCurrentIndex(index)
+        self.mission_filter.blockSignals(False)
+        if self.mission_filter.currentText() != current_mission_selection:
+            self.apply_filters()
 
     def apply_filters(self):
         """Apply current filters to the table view."""
@@ -567,56 +1026,40 @@ class ProcessingTrackerWidget(QWidget):
         qa_filter = self.qa_filter.currentText()
         mission_filter = self.mission_filter.currentText()
 
-        for row in range(self.processing_table.rowCount()):
-            show_row = True
-
-            # Processed filter
-            if processed_filter != "All":
-                processed_item = self.processing_table.item(row, 3)  # Processed column
-                if processed_item and processed_item.text() != processed_filter:
-                    show_row = False
-
-            # QA/QC filter
-            if qa_filter != "All":
-                qa_item = self.processing_table.item(row, 4)  # QA/QC column
-                if qa_item and qa_item.text() != qa_filter:
-                    show_row = False
-
-            # Mission filter
-            if mission_filter != "All Missions":
-                mission_item = self.processing_table.item(row, 5)  # Mission Date column
-                if mission_item:
-                    # Extract mission ID from filter text
-                    import re
-                    match = re.search(r'Mission (\d+)', mission_filter)
-                    if match:
-                        filter_mission_id = match.group(1)
-                        mission_id_item = self.processing_table.item(row, 8)  # Mission ID column
-                        if mission_id_item and mission_id_item.text() != filter_mission_id:
-                            show_row = False
-
-            self.processing_table.setRowHidden(row, not show_row)
+        # Extract mission ID from filter text
+        match = MISSION_FILTER_RE.search(mission_filter) if mission_filter != "All Missions" else None
+
+        filters = {
+            'processed': None if processed_filter == "All" else processed_filter,
+            'qa': None if qa_filter == "All" else qa_filter,
+            'mission_id': match.group(1) if match else None,
+        }
+        if any(filters.values()):
+            # Filter every processing entry, not only the pages fetched so far
+            self.load_all_rows()
+        # The proxy re-checks every row, including rows fetched later
+        self.proxy_model.set_filters(**filters)
 
     def load_processing_to_form(self, row, column):
         """Load processing entry details to the card view."""
-        id_item = self.processing_table.item(row, 0)
-        if not id_item or not id_item.text():
+        d = self.processing_model.row_dict(row)
+        if not d["ID"]:
             return
 
-        db_id_text = id_item.text().strip(' *')
-        if db_id_text.startswith(TEMP_ID_PREFIX):
+        processing_id = self.processing_model.row_db_id(row)
+        if processing_id is None:
             return  # Don't load details for new unsaved rows
 
-        try:
-            processing_id = int(db_id_text)
+        self._ensure_card_view()
 
-            # Get data from table
-            self.card_name_label.setText(self.processing_table.item(row, 1).text() if self.processing_table.item(row, 1) else "-")
-            self.card_chassis_label.setText(self.processing_table.item(row, 2).text() if self.processing_table.item(row, 2) else "-")
+        try:
+            # Get data from the row snapshot
+            self.card_name_label.setText(d["Name"])
+            self.card_chassis_label.setText(d["Chassis SN"])
 
             # Mission info
-            mission_date = self.processing_table.item(row, 5).text() if self.processing_table.item(row, 5) else ""
-            mission_id = self.processing_table.item(row, 8).text() if self.processing_table.item(row, 8) else ""
+            mission_date = d["Mission Date"]
+            mission_id = d["Mission ID"]
             if mission_id:
                 self.card_mission_label.setText(f"Mission {mission_id}")
             else:
@@ -624,20 +1067,20 @@ class ProcessingTrackerWidget(QWidget):
             self.card_date_label.setText(mission_date if mission_date else "-")
 
             # Site info
-            site_display = self.processing_table.item(row, 6).text() if self.processing_table.item(row, 6) else ""
+            site_display = d["Site"]
             self.card_site_label.setText(site_display if site_display else "-")
 
             # Status
-            processed_text = self.processing_table.item(row, 3).text() if self.processing_table.item(row, 3) else "No"
+            processed_text = d["Processed"]
             self.card_processed_label.setText(processed_text)
             self.update_status_color(self.card_processed_label, processed_text, "processed")
 
-            qa_text = self.processing_table.item(row, 4).text() if self.processing_table.item(row, 4) else "Needs Review"
+            qa_text = d["QA/QC"]
             self.card_qa_label.setText(qa_text)
             self.update_status_color(self.card_qa_label, qa_text, "qa")
 
             # Created date
-            created_text = self.processing_table.item(row, 7).text() if self.processing_table.item(row, 7) else ""
+            created_text = d["Created"]
             self.card_created_label.setText(created_text if created_text else "-")
 
             # Notes (would need to be fetched from database)
@@ -651,27 +1094,19 @@ class ProcessingTrackerWidget(QWidget):
 
     def update_status_color(self, label, value, status_type):
         """Update the color of a status label."""
-        if status_type == "processed":
-            if value == "Yes":
-                label.setStyleSheet("QLabel { padding: 5px; border-radius: 3px; font-weight: bold; background-color: #d4edda; color: #155724; }")
-            elif value == "No":
-                label.setStyleSheet("QLabel { padding: 5px; border-radius: 3px; font-weight: bold; background-color: #f8d7da; color: #721c24; }")
-            elif value == "Reprocess":
-                label.setStyleSheet("QLabel { padding: 5px; border-radius: 3px; font-weight: bold; background-color: #fff3cd; color: #856404; }")
-            else:
-                label.setStyleSheet("QLabel { padding: 5px; border-radius: 3px; font-weight: bold; }")
-        elif status_type == "qa":
-            if value == "Approved":
-                label.setStyleSheet("QLabel { padding: 5px; border-radius: 3px; font-weight: bold; background-color: #d4edda; color: #155724; }")
-            elif value == "Not Approved":
-                label.setStyleSheet("QLabel { padding: 5px; border-radius: 3px; font-weight: bold; background-color: #f8d7da; color: #721c24; }")
-            elif value == "Needs Review":
-                label.setStyleSheet("QLabel { padding: 5px; border-radius: 3px; font-weight: bold; background-color: #cce7ff; color: #004085; }")
-            else:
-                label.setStyleSheet("QLabel { padding: 5px; border-radius: 3px; font-weight: bold; }")
+        # The colours come from PROCESSING_WIDGET_QSS; re-polish so the new property is matched,
+        # but only on a change, as polishing restyles the label
+        if label.property("status") != value:
+            label.setProperty("status", value)
+            label.style().unpolish(label)
+            label.style().polish(label)
 
     def clear_card_view(self):
         """Clear the card view when no item is selected."""
+        if not self._card_built:
+            # Nothing shown yet; the card starts out cleared when it is built
+            self.current_selected_processing_id = None
+            return
         self.card_name_label.setText("-")
         self.card_chassis_label.setText("-")
         self.card_mission_label.setText("-")
@@ -702,15 +1137,9 @@ class ProcessingTrackerWidget(QWidget):
 
         try:
             # Get processing entry details from database
-            query = text("""
-                SELECT p.Name, p.Chassis_SN, m.date, s.name as site_name
-                FROM processing p
-                LEFT JOIN missions m ON p.Mission_ID = m.id
-                LEFT JOIN sites s ON p.Site_ID = s.site_ID
-                WHERE p.Process_ID = :process_id
-            """)
-
-            result = db_manager.session.execute(query, {'process_id': self.current_selected_processing_id}).fetchone()
+            result = db_manager.session.execute(
+                FOLDER_DETAILS_QUERY, {'process_id': self.current_selected_processing_id}
+            ).fetchone()
 
             if result:
                 processing_name = result.Name or "Unknown"
@@ -733,13 +1162,14 @@ class ProcessingTrackerWidget(QWidget):
                 folder_name = f"{mission_date}_{site_name.replace(' ', '_')}"
                 subfolder_name = f"{chassis_sn}_{processing_name.replace(' ', '_')}"
 
-                full_path = os.path.join(base_data_path, folder_name, subfolder_name)
+                full_path = os.sep.join((base_data_path, folder_name, subfolder_name))
 
-                # Create directory if it doesn't exist
-                if not os.path.exists(full_path):
-                    os.makedirs(full_path, exist_ok=True)
-                    QMessageBox.information(self, "Folder Created",
-                                          f"Data folder was created:\n{full_path}\n\nOpening folder...")
+                # Create directory if it doesn't exist; folders seen before skip the filesystem check
+                if full_path not in self._known_folders:
+                    if not os.path.exists(full_path):
+                        os.makedirs(full_path, exist_ok=True)
+                        self.status_bar.showMessage(f"Data folder created: {full_path}", STATUS_MESSAGE_TIMEOUT)
+                    self._known_folders.add(full_path)
 
                 # Open the folder in file explorer
                 self.open_folder_in_explorer(full_path)
@@ -753,14 +1183,12 @@ class ProcessingTrackerWidget(QWidget):
     def get_base_data_path(self):
         """Get the base data storage path. This can be configured as needed."""
         # You can make this configurable through settings or environment variables
-        # For now, using a default relative path
-        base_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'Data')
-
-        # Ensure the path exists
-        if not os.path.exists(base_path):
-            os.makedirs(base_path, exist_ok=True)
-
-        return os.path.abspath(base_path)
+        # For now, using a default path resolved once at import
+        if self._base_data_path is None:
+            # Ensure the path exists; it is created on first use only
+            BASE_DATA_ROOT.mkdir(parents=True, exist_ok=True)
+            self._base_data_path = str(BASE_DATA_ROOT)
+        return self._base_data_path
 
     def open_folder_in_explorer(self, path):
         """Open a folder in the system's file explorer."""
@@ -793,9 +1221,7 @@ class ProcessingTrackerWidget(QWidget):
 
         try:
             # Get the Mission_ID for this processing entry
-            processing = db_manager.session.query(self.Processing).filter_by(
-                Process_ID=self.current_selected_processing_id
-            ).first()
+            processing = db_manager.session.get(self.Processing, self.current_selected_processing_id)
 
             if not processing or not processing.Mission_ID:
                 QMessageBox.warning(self, "No Mission ID", "This processing entry is not linked to a mission.")
@@ -831,20 +1257,20 @@ class ProcessingTrackerWidget(QWidget):
             table = QTableWidget()
             table.setAlternatingRowColors(True)
             table.setSelectionBehavior(QAbstractItemView.SelectRows)
-            table.setSortingEnabled(True)
             table.horizontalHeader().setStretchLastSection(True)
             table.verticalHeader().setVisible(False)
 
             # Set up table headers
-            headers = ["Mission ID", "Date", "Platform", "Chassis", "Customer", "Site", "Outcome"]
-            table.setColumnCount(len(headers))
-            table.setHorizontalHeaderLabels(headers)
-
-            # Populate table with group missions
-            for mission in group_missions:
-                row_idx = table.rowCount()
-                table.insertRow(row_idx)
-
+            table.setColumnCount(len(GROUP_INFO_HEADERS))
+            table.setHorizontalHeaderLabels(GROUP_INFO_HEADERS)
+
+            # Populate table with group missions; the rows are allocated once rather than inserted one by one.
+            # Sorting, repaints and item signals stay off until every cell is in place, so setItem
+            # neither re-sorts the table nor moves rows under the loop.
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+            table.setRowCount(len(group_missions))
+            for row_idx, mission in enumerate(group_missions):
                 values = [
                     str(mission['mission_id']),
                     mission['date'],
@@ -858,8 +1284,16 @@ class ProcessingTrackerWidget(QWidget):
                 for col_idx, value in enumerate(values):
                     item = QTableWidgetItem(value)
                     table.setItem(row_idx, col_idx, item)
+            table.blockSignals(False)
+            table.setSortingEnabled(True)
+            table.setUpdatesEnabled(True)
 
-            table.resizeColumnsToContents()
+            # Measuring every cell is only worth it for small groups; large ones get preset widths
+            if len(group_missions) <= GROUP_INFO_FIT_LIMIT:
+                table.resizeColumnsToContents()
+            else:
+                for col, width in enumerate(GROUP_INFO_COLUMN_WIDTHS):
+                    table.setColumnWidth(col, width)
             layout.addWidget(table)
 
             # Summary info
@@ -880,17 +1314,23 @@ class ProcessingTrackerWidget(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to show group information: {e}")
 
+    def _new_temp_id(self):
+        """Temp ID for a new unsaved row; not derived from rowCount(), as unsaved rows are deleted locally."""
+        temp_id = f"{TEMP_ID_PREFIX}{self._next_temp_number}"
+        self._next_temp_number += 1
+        return temp_id
+
     def create_new_empty_row(self):
         """Create a new empty row for data entry."""
-        row_count = self.processing_table.rowCount()
-        self.processing_table.insertRow(row_count)
-        temp_id = f"{TEMP_ID_PREFIX}{row_count}"
-        self.processing_table.setItem(row_count, 0, QTableWidgetItem(temp_id))
-        self.processing_table.setItem(row_count, 3, QTableWidgetItem("No"))  # Default Processed status
-        self.processing_table.setItem(row_count, 4, QTableWidgetItem("Needs Review"))  # Default QA/QC status
-        self.processing_table.setItem(row_count, 7, QTableWidgetItem(datetime.now().strftime('%Y-%m-%d')))  # Creation date
-        self.unsaved_rows[temp_id] = True
-        self.processing_table.scrollToBottom()
+        temp_id = self._new_temp_id()
+        values = [""] * len(self.processing_model.headers)
+        values[0] = temp_id
+        values[3] = "No"  # Default Processed status
+        values[4] = "Needs Review"  # Default QA/QC status
+        values[7] = datetime.now().strftime('%Y-%m-%d')  # Creation date
+        row = self.processing_model.append_row(values)
+        self.unsaved_rows[temp_id] = QPersistentModelIndex(self.processing_model.index(row, 0))
+        self.processing_table.scrollTo(self._view_index(row, 0))
 
     def show_new_entry_menu(self):
         """Show the enhanced New Entry menu with import options."""
@@ -909,19 +1349,33 @@ class ProcessingTrackerWidget(QWidget):
         # Show menu at toolbar button position
         menu.exec_(self.toolbar.mapToGlobal(self.toolbar.rect().bottomLeft()))
 
+    def _on_processing_updated(self):
+        """Show processing entries written elsewhere, e.g. by background generation."""
+        # A reload discards pending edits; save_edits reloads after committing them anyway
+        if self.processing_model.dirty_cells or self.unsaved_rows:
+            return
+        self.load_data()
+
+    def invalidate_mission_browser_rows(self):
+        """Forget the mission browser rows so the next open queries them again."""
+        self._mission_browser_model = None
+
     def show_mission_browser_dialog(self):
         """Show the Mission Browser Dialog for importing mission data."""
-        dialog = MissionBrowserDialog(self.mission_dropdown_cache, self.site_dropdown_cache, parent=self)
+        dialog = MissionBrowserDialog(self.mission_dropdown_cache, self.site_dropdown_cache,
+                                      mission_model=self._mission_browser_model, parent=self)
+        # Reopening lists the same rows without querying until missions or sites change
+        self._mission_browser_model = dialog.mission_model
         if dialog.exec_() == QDialog.Accepted:
             selected_mission = dialog.get_selected_mission()
             if selected_mission:
                 self.create_processing_from_mission(selected_mission)
+        # The rows model outlives the dialog; the dialog and its proxy go now
+        dialog.deleteLater()
 
     def create_processing_from_mission(self, mission_data):
         """Create a new processing entry from selected mission data."""
-        row_count = self.processing_table.rowCount()
-        self.processing_table.insertRow(row_count)
-        temp_id = f"{TEMP_ID_PREFIX}{row_count}"
+        temp_id = self._new_temp_id()
 
         # Auto-populate fields from mission data
         mission_id = mission_data.get('id', '')
@@ -930,126 +1384,139 @@ class ProcessingTrackerWidget(QWidget):
         name = f"Mission {mission_id} Processing"
 
         # Set values in table
-        self.processing_table.setItem(row_count, 0, QTableWidgetItem(temp_id))
-        self.processing_table.setItem(row_count, 1, QTableWidgetItem(name))  # Name
-        self.processing_table.setItem(row_count, 2, QTableWidgetItem(chassis))  # Chassis SN
-        self.processing_table.setItem(row_count, 3, QTableWidgetItem("No"))  # Processed
-        self.processing_table.setItem(row_count, 4, QTableWidgetItem("Needs Review"))  # QA/QC
-        self.processing_table.setItem(row_count, 5, QTableWidgetItem(mission_date))  # Mission Date
-        self.processing_table.setItem(row_count, 7, QTableWidgetItem(datetime.now().strftime('%Y-%m-%d')))  # Created
-        self.processing_table.setItem(row_count, 8, QTableWidgetItem(str(mission_id)))  # Mission ID
+        values = [""] * len(self.processing_model.headers)
+        values[0] = temp_id
+        values[1] = name  # Name
+        values[2] = chassis or ""  # Chassis SN
+        values[3] = "No"  # Processed
+        values[4] = "Needs Review"  # QA/QC
+        values[5] = mission_date or ""  # Mission Date
+        values[7] = datetime.now().strftime('%Y-%m-%d')  # Created
+        values[8] = str(mission_id)  # Mission ID
+        row = self.processing_model.append_row(values)
 
         # Mark as unsaved
-        self.unsaved_rows[temp_id] = True
-        self.processing_table.scrollToBottom()
+        self.unsaved_rows[temp_id] = QPersistentModelIndex(self.processing_model.index(row, 0))
+        self.processing_table.scrollTo(self._view_index(row, 0))
 
-        QMessageBox.information(self, "Entry Created",
-                              f"New processing entry created for Mission {mission_id}.\n\n"
-                              f"You can now set the data folder path and save the entry.")
+        self.status_bar.showMessage(f"New processing entry created for Mission {mission_id}. "
+                                    f"Set the data folder path and save the entry.", STATUS_MESSAGE_TIMEOUT)
 
     def save_edits(self):
         """Save all pending edits."""
-        if not self.edited_cells and not self.unsaved_rows:
+        model = self.processing_model
+        if not model.dirty_cells and not self.unsaved_rows:
             QMessageBox.information(self, "No Changes", "There are no pending changes to save.")
             return
 
         try:
             saved_count = 0
+            today = date.today()  # Fallback creation date for every row saved in this pass
 
-            # Handle new rows first
-            for temp_id in list(self.unsaved_rows.keys()):
-                row_idx = -1
-                for i in range(self.processing_table.rowCount()):
-                    item = self.processing_table.item(i, 0)
-                    if item and item.text() == temp_id:
-                        row_idx = i
-                        break
-
-                if row_idx == -1:
+            # Handle new rows first; they are inserted together with a single flush
+            pending = []  # (new Processing object, row index)
+            for temp_id, row_index in list(self.unsaved_rows.items()):
+                # Persistent indexes follow their rows through removals, so no table scan is needed
+                if not row_index.isValid():
                     continue
+                row_idx = row_index.row()
 
                 # Skip empty rows
                 if not self._is_row_has_data(row_idx):
                     continue
 
-                headers = [self.processing_table.horizontalHeaderItem(c).text()
-                         for c in range(self.processing_table.columnCount())]
                 processing_data = {}
 
-                for col, header in enumerate(headers):
-                    if header == 'ID':
-                        continue
-
-                    item = self.processing_table.item(row_idx, col)
-                    if not item:
-                        continue
-
-                    text = item.text().strip()
-                    col_name = header.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('/', '_')
+                for col, col_name in PROCESSING_COLUMN_NAMES.items():
+                    text = model.cell_text(row_idx, col).strip()
 
                     # Handle different data types
                     if not text:
                         processing_data[col_name] = None
-                    elif header == 'Created':
+                    elif col_name == 'Creation Date':
                         try:
-                            processing_data[col_name] = datetime.strptime(text, '%Y-%m-%d').date()
+                            processing_data[col_name] = date.fromisoformat(text)
                         except ValueError:
-                            processing_data[col_name] = datetime.now().date()
-                    elif header in ['Mission ID', 'Site ID']:
+                            processing_data[col_name] = today
+                    elif col_name in ['Mission_ID', 'Site_ID']:
                         try:
-                            processing_data[col_name] = int(text) if text else None
+                            processing_data[col_name] = int(text)
                         except ValueError:
                             processing_data[col_name] = None
                     else:
                         processing_data[col_name] = text
 
                 try:
-                    new_processing = self.Processing(**processing_data)
-                    db_manager.session.add(new_processing)
-                    saved_count += 1
+                    pending.append((self.Processing(**processing_data), row_idx))
+                except Exception as e:
+                    QMessageBox.warning(self, "Save Error",
+                                     f"Failed to save row {row_idx + 1}: {str(e)}")
 
-                    # Update the temp ID to real ID
+            if pending:
+                try:
+                    db_manager.session.add_all([new_processing for new_processing, _ in pending])
                     db_manager.session.flush()
-                    self.processing_table.item(row_idx, 0).setText(str(new_processing.Process_ID))
+                    saved_count += len(pending)
+
+                    # Update the temp IDs to the real IDs assigned by the flush
+                    for new_processing, row_idx in pending:
+                        model.set_cell_text(row_idx, 0, str(new_processing.Process_ID))
 
                 except Exception as e:
                     db_manager.session.rollback()
-                    QMessageBox.warning(self, "Save Error",
-                                     f"Failed to save row {row_idx + 1}: {str(e)}")
-
-            # Handle cell edits for existing processing entries
-            for (row, col), new_value in self.edited_cells.items():
-                db_id_item = self.processing_table.item(row, 0)
-                if not db_id_item or db_id_item.text().startswith(TEMP_ID_PREFIX):
+                    QMessageBox.warning(self, "Save Error", f"Failed to save new rows: {str(e)}")
+
+            # Handle cell edits for existing processing entries, grouped so each entry is loaded once
+            edits_by_id = {}  # Process_ID -> [(row, col, column name, new text)]
+            for row, cols in sorted(model.dirty_cells_by_row.items()):
+                # The row's ID is looked up once for all of its edited cells
+                db_id = model.row_db_id(row)
+                if db_id is None:
                     continue
+                edits_by_id.setdefault(db_id, []).extend(
+                    (row, col, PROCESSING_COLUMN_NAMES[col], model.cell_text(row, col))
+                    for col in sorted(cols) if col in PROCESSING_COLUMN_NAMES)
+
+            # Load every edited entry in one IN query rather than one SELECT per entry
+            entries_by_id = {}
+            if edits_by_id:
+                entries_by_id = {
+                    processing.Process_ID: processing
+                    for processing in db_manager.session.query(self.Processing).filter(
+                        self.Processing.Process_ID.in_(edits_by_id)
+                    )
+                }
 
-                try:
-                    db_id = int(db_id_item.text().strip(' *'))
-                    column_name = self.processing_table.horizontalHeaderItem(col).text().lower().replace(' ', '_').replace('(', '').replace(')', '').replace('/', '_')
-                    processing = db_manager.session.query(self.Processing).filter_by(Process_ID=db_id).first()
+            for db_id, edits in edits_by_id.items():
+                processing = entries_by_id.get(db_id)
+                if not processing:
+                    continue
 
-                    if processing:
+                for row, col, column_name, new_value in edits:
+                    try:
                         # Convert value to appropriate type
-                        if column_name == 'created':
-                            new_value = datetime.strptime(new_value, '%Y-%m-%d').date() if new_value else datetime.now().date()
-                        elif column_name in ['mission_id', 'site_id']:
+                        if column_name == 'Creation Date':
+                            new_value = date.fromisoformat(new_value) if new_value else today
+                        elif column_name in ['Mission_ID', 'Site_ID']:
                             try:
                                 new_value = int(new_value) if new_value else None
                             except (ValueError, TypeError):
                                 new_value = None
 
+                        # Leave columns that already hold the value alone, so no UPDATE is issued for them
+                        if getattr(processing, column_name) == new_value:
+                            continue
                         setattr(processing, column_name, new_value)
                         saved_count += 1
 
-                except Exception as e:
-                    db_manager.session.rollback()
-                    QMessageBox.warning(self, "Update Error",
-                                     f"Failed to update cell at row {row + 1}, column {col + 1}: {str(e)}")
+                    except Exception as e:
+                        db_manager.session.rollback()
+                        QMessageBox.warning(self, "Update Error",
+                                         f"Failed to update cell at row {row + 1}, column {col + 1}: {str(e)}")
 
             if saved_count > 0:
                 db_manager.session.commit()
                 QMessageBox.information(self, "Success", f"Successfully saved {saved_count} changes.")
-                self.edited_cells.clear()
                 self.unsaved_rows.clear()
                 self.load_data()  # Refresh the table
             else:
@@ -1061,7 +1528,8 @@ class ProcessingTrackerWidget(QWidget):
 
     def delete_selected(self):
         """Delete the selected processing entry."""
-        selected_rows = sorted(list(set(index.row() for index in self.processing_table.selectedIndexes())), reverse=True)
+        selected_rows = sorted({self._source_cell(index)[0] for index in self.processing_table.selectedIndexes()},
+                               reverse=True)
         if not selected_rows:
             return
 
@@ -1069,19 +1537,21 @@ class ProcessingTrackerWidget(QWidget):
         if reply == QMessageBox.Yes:
             try:
                 deleted_count = 0
+                db_ids = []
                 for row in selected_rows:
-                    id_item = self.processing_table.item(row, 0)
-                    if id_item.text().startswith(TEMP_ID_PREFIX):
+                    db_id = self.processing_model.row_db_id(row)
+                    if db_id is None:
                         # Just remove from table for unsaved rows
-                        self.processing_table.removeRow(row)
-                        if id_item.text() in self.unsaved_rows:
-                            del self.unsaved_rows[id_item.text()]
+                        self.unsaved_rows.pop(self.processing_model.cell_text(row, 0), None)
+                        self.processing_model.remove_row(row)
                     else:
-                        db_id = int(id_item.text().strip(' *'))
-                        processing = db_manager.session.query(self.Processing).filter_by(Process_ID=db_id).first()
-                        if processing:
-                            db_manager.session.delete(processing)
-                            deleted_count += 1
+                        db_ids.append(db_id)
+
+                # Saved entries go in one DELETE ... WHERE Process_ID IN (...) statement
+                if db_ids:
+                    deleted_count = db_manager.session.query(self.Processing).filter(
+                        self.Processing.Process_ID.in_(db_ids)
+                    ).delete(synchronize_session=False)
 
                 if deleted_count > 0:
                     db_manager.session.commit()
@@ -1094,78 +1564,68 @@ class ProcessingTrackerWidget(QWidget):
                 db_manager.session.rollback()
                 QMessageBox.critical(self, "Error", f"Failed to delete entries: {e}")
 
-    def cell_pressed_for_edit(self, row, column):
-        """Handle cell press for edit tracking."""
-        if not self.updating_table:
-            item = self.processing_table.item(row, column)
-            self.current_edit_original_value = item.text() if item else ""
-
-    def cell_was_edited(self, row, column):
+    def cell_was_edited(self, row, column, old_value):
         """Handle cell editing."""
         if self.updating_table or self.is_undoing or self.is_redoing:
             return
 
-        current_item = self.processing_table.item(row, column)
-        new_value = current_item.text() if current_item else ""
-
-        if new_value == self.current_edit_original_value:
-            return
-
-        db_id_item = self.processing_table.item(row, 0)
-        db_id = db_id_item.text()
-        column_name = self.processing_table.horizontalHeaderItem(column).text()
+        model = self.processing_model
+        new_value = model.cell_text(row, column)
+        db_id = model.cell_text(row, 0)
 
         edit_record = {
             "db_id": db_id, "row": row, "column": column,
-            "old_value": self.current_edit_original_value, "new_value": new_value
+            "old_value": old_value, "new_value": new_value
         }
         self.undo_stack.append(edit_record)
         self.redo_stack.clear()
 
-        self.edited_cells[(row, column)] = new_value
-        current_item.setBackground(QColor("#d08770"))
-        if not db_id.endswith(' *'):
-            db_id_item.setText(f"{db_id} *")
+        if new_value == self._original_cell_text(model.row_db_id(row), column):
+            # Edited back to the loaded value, so there is nothing to save for this cell
+            model.clear_dirty(row, column)
+            return
+
+        # The model marks the row's ID with ' *' while it has unsaved edits
+        model.mark_dirty(row, column)
+
+    def _original_cell_text(self, db_id, column):
+        """Text a cell showed when its row was loaded; None for unsaved NEW_ rows (db_id None)."""
+        original = self.original_table_data.get(db_id) if db_id is not None else None
+        return original[column] if original else None
 
     def populate_dropdown_caches(self):
-        """Populate dropdown caches with mission and site data."""
-        try:
-            # Populate mission dropdown cache
-            if self.Missions:
-                missions = db_manager.session.query(self.Missions).all()
-                self.mission_dropdown_cache = {}
-                for mission in missions:
-                    mission_date = ""
-                    if mission.date:
-                        if hasattr(mission.date, 'strftime'):
-                            mission_date = mission.date.strftime('%Y-%m-%d')
-                        else:
-                            mission_date = str(mission.date)
-                    display_text = f"Mission {mission.id}"
-                    if mission_date:
-                        display_text += f" ({mission_date})"
-                    self.mission_dropdown_cache[mission.id] = display_text
-
-            # Populate site dropdown cache
-            if self.Sites:
-                sites = db_manager.session.query(self.Sites).all()
-                self.site_dropdown_cache = {}
-                for site in sites:
-                    display_text = site.name or "Unknown"
-                    if site.location:
-                        display_text += f" ({site.location})"
-                    self.site_dropdown_cache[site.site_ID] = display_text
+        """
+        Populate dropdown caches with mission and site data.
+        Built from the lookups _load_lookups just read, so no further queries or ORM objects are needed.
+        """
+        self.mission_dropdown_cache = {
+            mission_id: f"Mission {mission_id} ({mission_date})" if mission_date else f"Mission {mission_id}"
+            for mission_id, mission_date in self._mission_dates.items()
+        }
+        # Sorted by mission ID once here rather than on every dropdown
+        self._fill_combo_model(self.mission_combo_model, sorted(self.mission_dropdown_cache.items()))
 
-        except Exception as e:
-            print(f"Error populating dropdown caches: {e}")
+        self.site_dropdown_cache = {
+            site_id: f"{name or 'Unknown'} ({location})" if location else name or "Unknown"
+            for site_id, (name, location, _) in self._site_lookup.items()
+        }
+        # Sorted by site name once here rather than on every dropdown
+        self._fill_combo_model(self.site_combo_model,
+                               sorted(self.site_dropdown_cache.items(), key=lambda x: x[1]))
+
+    def _fill_combo_model(self, combo_model, options):
+        """Refill a shared dropdown model with an empty option followed by (id, text) options."""
+        combo_model.clear()
+        combo_model.appendRow(QStandardItem(""))  # Empty option
+        for option_id, display_text in options:
+            item = QStandardItem(display_text)
+            item.setData(option_id, Qt.UserRole)
+            combo_model.appendRow(item)
 
     def _is_row_has_data(self, row_idx):
         """Check if a row has any non-empty data cells (excluding ID column)."""
-        for col in range(1, self.processing_table.columnCount()):
-            item = self.processing_table.item(row_idx, col)
-            if item and item.text().strip():
-                return True
-        return False
+        model = self.processing_model
+        return any(model.cell_text(row_idx, col).strip() for col in range(1, model.columnCount()))
 
     def undo_last_edit(self):
         """Undo the last edit."""
@@ -1180,25 +1640,14 @@ class ProcessingTrackerWidget(QWidget):
             row, col = last_edit['row'], last_edit['column']
             old_value = last_edit['old_value']
 
+            model = self.processing_model
+
             # Update the cell value
-            self.processing_table.item(row, col).setText(old_value)
-
-            # Remove from edited cells if it reverts to original
-            if (row, col) in self.edited_cells:
-                del self.edited_cells[(row, col)]
-
-            # Reset background color
-            self.processing_table.item(row, col).setBackground(QColor())
-
-            # Update asterisk in ID column if no more edits in this row
-            id_item = self.processing_table.item(row, 0)
-            if id_item:
-                db_id = id_item.text().strip(' *')
-                has_edits = any((row, c) in self.edited_cells for c in range(1, self.processing_table.columnCount()))
-                if not has_edits:
-                    id_item.setText(db_id)
-                else:
-                    id_item.setText(f"{db_id} *")
+            model.setData(model.index(row, col), old_value)
+
+            # Remove from edited cells (this also resets the background color and,
+            # once the row has no edits left, the ID's ' *' marker)
+            model.clear_dirty(row, col)
 
         except Exception as e:
             QMessageBox.warning(self, "Undo Error", f"Failed to undo edit: {e}")
@@ -1218,218 +1667,146 @@ class ProcessingTrackerWidget(QWidget):
             row, col = last_undone_edit['row'], last_undone_edit['column']
             new_value = last_undone_edit['new_value']
 
-            # Update the cell value
-            self.processing_table.item(row, col).setText(new_value)
-
-            # Add back to edited cells
-            self.edited_cells[(row, col)] = new_value
+            model = self.processing_model
 
-            # Set background color
-            self.processing_table.item(row, col).setBackground(QColor("#d08770"))
+            # Update the cell value
+            model.setData(model.index(row, col), new_value)
 
-            # Update asterisk in ID column
-            id_item = self.processing_table.item(row, 0)
-            if id_item and not id_item.text().endswith(' *'):
-                db_id = id_item.text().strip(' *')
-                id_item.setText(f"{db_id} *")
+            # Add back to edited cells (highlighted and ' *'-marked by the model)
+            model.mark_dirty(row, col)
 
         except Exception as e:
             QMessageBox.warning(self, "Redo Error", f"Failed to redo edit: {e}")
         finally:
             self.is_redoing = False
 
-    def handle_cell_double_click(self, row, column):
-        """Handle double-click on table cells to show appropriate editors."""
-        column_name = self.processing_table.horizontalHeaderItem(column).text()
-
-        # Show dropdown for Mission ID column
-        if column_name == "Mission ID":
-            self.show_mission_dropdown(row, column)
-        # Show dropdown for Site ID column
-        elif column_name == "Site ID":
-            self.show_site_dropdown(row, column)
-        # Show dropdown for Processed column
-        elif column_name == "Processed":
-            self.show_processed_dropdown(row, column)
-        # Show dropdown for QA/QC column
-        elif column_name == "QA/QC":
-            self.show_qa_dropdown(row, column)
-
-    def show_mission_dropdown(self, row, column):
-        """Show dropdown for mission selection."""
-        if not self.mission_dropdown_cache:
-            QMessageBox.warning(self, "No Data", "No mission data available.")
-            return
-
-        # Create dropdown widget
-        combo = QComboBox()
-        combo.addItem("")  # Empty option
-
-        # Add mission options
-        mission_options = []
-        for mission_id, display_text in self.mission_dropdown_cache.items():
-            mission_options.append((mission_id, display_text))
-
-        # Sort by mission ID
-        mission_options.sort(key=lambda x: x[0])
 
-        for mission_id, display_text in mission_options:
-            combo.addItem(display_text, mission_id)
-
-        # Set current value if exists
-        current_item = self.processing_table.item(row, column)
-        if current_item:
-            current_text = current_item.text().strip()
-            if current_text:
-                try:
-                    current_id = int(current_text)
-                    for i in range(combo.count()):
-                        if combo.itemData(i) == current_id:
-                            combo.setCurrentIndex(i)
-                            break
-                except ValueError:
-                    pass
-
-        # Position and show dropdown
-        rect = self.processing_table.visualItemRect(self.processing_table.item(row, column))
-        combo.setGeometry(rect)
-        combo.setParent(self.processing_table)
-        combo.show()
-        combo.setFocus()
-
-        # Connect to update function
-        combo.currentIndexChanged.connect(lambda: self.update_cell_from_dropdown(row, column, combo))
-
-    def show_site_dropdown(self, row, column):
-        """Show dropdown for site selection."""
-        if not self.site_dropdown_cache:
-            QMessageBox.warning(self, "No Data", "No site data available.")
+def _fetch_mission_browser_page(offset, limit):
+    """Fetch one page of mission browser rows as (cell texts, search text, mission data) tuples."""
+    rows = []
+    # Streamed in batches, so fetching every remaining mission at once never buffers the whole result twice
+    result = db_manager.session.execute(
+        MISSION_BROWSER_QUERY.execution_options(stream_results=True),
+        {'limit': limit, 'offset': offset}
+    ).yield_per(MISSION_BROWSER_PAGE_SIZE)
+    for row in result.mappings():
+        mission_date = row["date"]
+
+        # Format site display
+        site_display = ""
+        if row["site_name"]:
+            site_display = row["site_name"]
+            if row["site_location"]:
+                site_display += f" ({row['site_location']})"
+
+        platform = row["platform"] or ""
+        chassis = row["chassis"] or ""
+        values = [str(row["id"]), mission_date, platform, chassis, site_display]
+        # The search text is matched by the proxy instead of re-reading every cell on each keystroke
+        rows.append((values, " ".join(values).lower(), {
+            'id': row["id"],
+            'date': mission_date,
+            'platform': platform,
+            'chassis': chassis,
+            'site': site_display,
+            'site_id': row["site"]
+        }))
+    return rows
+
+
+class MissionBrowserModel(QAbstractTableModel):
+    """
+    Read-only table model listing missions for the mission browser.
+    Rows are (cell texts, lowercased search text, mission data) tuples.
+    Database rows arrive in pages through fetchMore() as the view scrolls.
+    """
+
+    def __init__(self, fetch_rows=None, total_count=0, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._fetch_rows = fetch_rows  # callable(offset, limit) -> list of rows, or None when nothing to page
+        self._total_count = total_count  # database rows available
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(MISSION_BROWSER_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][0][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(MISSION_BROWSER_HEADERS):
+            return MISSION_BROWSER_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetch_rows is not None and len(self._rows) < self._total_count
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._append_fetched(self._fetch_rows(len(self._rows), MISSION_BROWSER_PAGE_SIZE))
+
+    def fetch_all(self):
+        """Fetch all remaining database rows in one go."""
+        if self.canFetchMore():
+            self._append_fetched(self._fetch_rows(len(self._rows), self._total_count - len(self._rows)))
+
+    def _append_fetched(self, rows):
+        if not rows:
+            # The table shrank since it was counted; stop paging
+            self._total_count = len(self._rows)
             return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
 
-        # Create dropdown widget
-        combo = QComboBox()
-        combo.addItem("")  # Empty option
+    def row_values(self, row):
+        return self._rows[row][0]
 
-        # Add site options
-        site_options = []
-        for site_id, display_text in self.site_dropdown_cache.items():
-            site_options.append((site_id, display_text))
+    def search_text(self, row):
+        return self._rows[row][1]
 
-        # Sort by site name
-        site_options.sort(key=lambda x: x[1])
+    def mission_data(self, row):
+        return self._rows[row][2]
 
-        for site_id, display_text in site_options:
-            combo.addItem(display_text, site_id)
 
-        # Set current value if exists
-        current_item = self.processing_table.item(row, column)
-        if current_item:
-            current_text = current_item.text().strip()
-            if current_text:
-                try:
-                    current_id = int(current_text)
-                    for i in range(combo.count()):
-                        if combo.itemData(i) == current_id:
-                            combo.setCurrentIndex(i)
-                            break
-                except ValueError:
-                    pass
-
-        # Position and show dropdown
-        rect = self.processing_table.visualItemRect(self.processing_table.item(row, column))
-        combo.setGeometry(rect)
-        combo.setParent(self.processing_table)
-        combo.show()
-        combo.setFocus()
-
-        # Connect to update function
-        combo.currentIndexChanged.connect(lambda: self.update_cell_from_dropdown(row, column, combo))
-
-    def show_processed_dropdown(self, row, column):
-        """Show dropdown for processed status."""
-        combo = QComboBox()
-        combo.addItem("Yes")
-        combo.addItem("No")
-        combo.addItem("Reprocess")
-
-        # Set current value
-        current_item = self.processing_table.item(row, column)
-        if current_item:
-            current_text = current_item.text().strip()
-            index = combo.findText(current_text)
-            if index >= 0:
-                combo.setCurrentIndex(index)
-
-        # Position and show dropdown
-        rect = self.processing_table.visualItemRect(self.processing_table.item(row, column))
-        combo.setGeometry(rect)
-        combo.setParent(self.processing_table)
-        combo.show()
-        combo.setFocus()
-
-        # Connect to update function
-        combo.currentIndexChanged.connect(lambda: self.update_cell_from_dropdown(row, column, combo))
-
-    def show_qa_dropdown(self, row, column):
-        """Show dropdown for QA/QC status."""
-        combo = QComboBox()
-        combo.addItem("Needs Review")
-        combo.addItem("Approved")
-        combo.addItem("Not Approved")
-
-        # Set current value
-        current_item = self.processing_table.item(row, column)
-        if current_item:
-            current_text = current_item.text().strip()
-            index = combo.findText(current_text)
-            if index >= 0:
-                combo.setCurrentIndex(index)
-
-        # Position and show dropdown
-        rect = self.processing_table.visualItemRect(self.processing_table.item(row, column))
-        combo.setGeometry(rect)
-        combo.setParent(self.processing_table)
-        combo.show()
-        combo.setFocus()
-
-        # Connect to update function
-        combo.currentIndexChanged.connect(lambda: self.update_cell_from_dropdown(row, column, combo))
-
-    def update_cell_from_dropdown(self, row, column, combo):
-        """Update cell value from dropdown selection."""
-        selected_text = combo.currentText()
-        selected_data = combo.currentData()
-
-        # For Mission ID and Site ID, store the ID but display the text
-        column_name = self.processing_table.horizontalHeaderItem(column).text()
-        if column_name in ["Mission ID", "Site ID"] and selected_data is not None:
-            # Store the ID in the cell
-            display_text = str(selected_data) if selected_data else ""
-        else:
-            # For other columns, use the display text
-            display_text = selected_text
+class MissionBrowserProxyModel(QSortFilterProxyModel):
+    """Keeps the mission browser rows whose search text contains the search box text."""
 
-        # Update the cell
-        item = self.processing_table.item(row, column)
-        if item:
-            item.setText(display_text)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search_text = ""
 
-            # Trigger the edit handler
-            self.cell_was_edited(row, column)
+    def set_search_text(self, search_text):
+        self._search_text = search_text.lower()
+        self.invalidateFilter()
 
-        # Close the dropdown
-        combo.hide()
-        combo.setParent(None)
+    def filterAcceptsRow(self, source_row, source_parent):
+        return not self._search_text or self._search_text in self.sourceModel().search_text(source_row)
 
 
 class MissionBrowserDialog(QDialog):
     """Dialog for browsing and selecting missions to import for processing."""
 
-    def __init__(self, mission_cache, site_cache, parent=None):
+    def __init__(self, mission_cache, site_cache, mission_model=None, parent=None):
         super().__init__(parent)
         self.mission_cache = mission_cache
         self.site_cache = site_cache
+        self.mission_model = mission_model  # MissionBrowserModel from an earlier open; built when None
         self.selected_mission = None
+        self._details_cache = {}  # mission id -> details preview text
+        self._details_mission_id = None  # Mission currently shown in the details preview
+
+        # Timer for debouncing search input
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)  # 150ms delay
+        self.search_timer.timeout.connect(self.filter_missions)
 
         self.setWindowTitle("Select Mission for Processing")
         self.setModal(True)
@@ -1452,25 +1829,25 @@ class MissionBrowserDialog(QDialog):
         filter_layout.addWidget(QLabel("Search:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by mission ID, date, or platform...")
-        self.search_input.textChanged.connect(self.filter_missions)
+        self.search_input.textChanged.connect(self.search_timer.start)
         filter_layout.addWidget(self.search_input)
         filter_layout.addStretch()
         layout.addLayout(filter_layout)
 
-        # Missions table
-        self.missions_table = QTableWidget()
+        # Missions table; the proxy filters and sorts, the source model is set by load_missions
+        self.proxy_model = MissionBrowserProxyModel(self)
+        self.missions_table = QTableView()
+        self.missions_table.setModel(self.proxy_model)
         self.missions_table.setAlternatingRowColors(True)
         self.missions_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.missions_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        # Unsorted until a header is clicked, so missions keep the query's newest-first order
+        self.missions_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self.missions_table.setSortingEnabled(True)
+        self.missions_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.missions_table.horizontalHeader().setStretchLastSection(True)
         self.missions_table.verticalHeader().setVisible(False)
 
-        # Set up table headers
-        headers = ["Mission ID", "Date", "Platform", "Chassis", "Site"]
-        self.missions_table.setColumnCount(len(headers))
-        self.missions_table.setHorizontalHeaderLabels(headers)
-
         layout.addWidget(self.missions_table)
 
         # Mission details preview
@@ -1500,150 +1877,140 @@ class MissionBrowserDialog(QDialog):
         layout.addLayout(button_layout)
 
         # Connect signals
-        self.missions_table.itemSelectionChanged.connect(self.update_details)
-        self.missions_table.itemDoubleClicked.connect(self.select_mission)
+        self.missions_table.selectionModel().selectionChanged.connect(self.update_details)
+        self.missions_table.doubleClicked.connect(self.select_mission)
+        # Sorting by a column orders every mission, not only the pages fetched so far
+        self.missions_table.horizontalHeader().sortIndicatorChanged.connect(self._fetch_all_missions)
 
     def load_missions(self):
         """Load missions into the table."""
-        self.missions_table.setRowCount(0)
-
-        # Get mission data from database with JOIN to sites
-        try:
-            from app.database.manager import db_manager
-            from sqlalchemy import text
-
-            if db_manager.session:
-                # Query to get missions with site information
-                query = text("""
-                    SELECT
-                        m.id,
-                        m.date,
-                        m.platform,
-                        m.chassis,
-                        m.site,
-                        s.name as site_name,
-                        s.location as site_location
-                    FROM missions m
-                    LEFT JOIN sites s ON m.site = s.site_ID
-                    ORDER BY m.date DESC, m.id DESC
-                """)
-
-                result = db_manager.session.execute(query).fetchall()
-
-                for row in result:
-                    row_idx = self.missions_table.rowCount()
-                    self.missions_table.insertRow(row_idx)
-
-                    # Format mission data
-                    mission_date = ""
-                    if row.date:
-                        if hasattr(row.date, 'strftime'):
-                            mission_date = row.date.strftime('%Y-%m-%d')
-                        else:
-                            mission_date = str(row.date)
-
-                    # Format site display
-                    site_display = ""
-                    if row.site_name:
-                        site_display = row.site_name
-                        if row.site_location:
-                            site_display += f" ({row.site_location})"
-
-                    # Set table values
-                    values = [
-                        str(row.id),
-                        mission_date,
-                        row.platform or "",
-                        row.chassis or "",
-                        site_display
-                    ]
-
-                    for col_idx, value in enumerate(values):
-                        item = QTableWidgetItem(value)
-                        self.missions_table.setItem(row_idx, col_idx, item)
-
-                    # Store mission data in first column for retrieval
-                    self.missions_table.item(row_idx, 0).setData(Qt.UserRole, {
-                        'id': row.id,
-                        'date': mission_date,
-                        'platform': row.platform or "",
-                        'chassis': row.chassis or "",
-                        'site': site_display,
-                        'site_id': row.site
-                    })
-
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load missions: {e}")
-            print(f"Mission loading error: {e}")
-
-        self.missions_table.resizeColumnsToContents()
+        model = self.mission_model
+        if model is None:
+            model = MissionBrowserModel()
+            # Count the missions and fetch the first page; the view fetches the rest as it scrolls
+            try:
+                if db_manager.session:
+                    total_count = db_manager.session.execute(MISSION_COUNT_QUERY).scalar()
+                    model = MissionBrowserModel(_fetch_mission_browser_page, total_count)
+                    model.fetchMore()
+                    self.mission_model = model
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Failed to load missions: {e}")
+                print(f"Mission loading error: {e}")
+        self.proxy_model.setSourceModel(model)
+
+        # Size the columns from the longest text on the fetched rows instead of resizing to every cell
+        longest = list(MISSION_BROWSER_HEADERS)
+        for row in range(model.rowCount()):
+            for col_idx, value in enumerate(model.row_values(row)):
+                if len(value) > len(longest[col_idx]):
+                    longest[col_idx] = value
+        font_metrics = self.missions_table.fontMetrics()
+        for col, text_value in enumerate(longest):
+            self.missions_table.setColumnWidth(
+                col, font_metrics.horizontalAdvance(text_value) + MISSION_BROWSER_CELL_PADDING)
+
+    def _fetch_all_missions(self):
+        """Fetch every remaining page of missions at once."""
+        if self.mission_model is not None:
+            self.mission_model.fetch_all()
 
     def filter_missions(self):
         """Filter missions based on search text."""
-        search_text = self.search_input.text().lower()
-
-        for row in range(self.missions_table.rowCount()):
-            show_row = True
-
-            if search_text:
-                # Check if any column contains the search text
-                row_text = ""
-                for col in range(self.missions_table.columnCount()):
-                    item = self.missions_table.item(row, col)
-                    if item:
-                        row_text += item.text().lower() + " "
-
-                if search_text not in row_text:
-                    show_row = False
-
-            self.missions_table.setRowHidden(row, not show_row)
-
-    def update_details(self):
-        """Update the mission details preview."""
+        search_text = self.search_input.text()
+        if search_text:
+            # Search every mission, not only the pages fetched so far
+            self._fetch_all_missions()
+        self.proxy_model.set_search_text(search_text)
+
+    def _selected_mission_data(self):
+        """Mission data of the selected row, straight from the model's row list; None without a selection."""
         selected_rows = self.missions_table.selectionModel().selectedRows()
         if not selected_rows:
-            self.details_text.clear()
-            self.select_btn.setEnabled(False)
-            return
+            return None
+        return self.proxy_model.sourceModel().mission_data(self.proxy_model.mapToSource(selected_rows[0]).row())
 
-        row = selected_rows[0].row()
-        mission_data = self.missions_table.item(row, 0).data(Qt.UserRole)
+    def update_details(self):
+        """Update the mission details preview."""
+        mission_data = self._selected_mission_data()
 
         if mission_data:
-            details = f"""
+            # Reselecting the shown mission leaves the preview as it is
+            if mission_data['id'] != self._details_mission_id:
+                self._details_mission_id = mission_data['id']
+                details = self._details_cache.get(mission_data['id'])
+                if details is None:
+                    details = f"""
 Mission ID: {mission_data['id']}
 Date: {mission_data['date']}
 Platform: {mission_data['platform']}
 Chassis: {mission_data['chassis']}
 Site: {mission_data['site']}
-"""
-            self.details_text.setPlainText(details.strip())
+""".strip()
+                    self._details_cache[mission_data['id']] = details
+                self.details_text.setPlainText(details)
             self.select_btn.setEnabled(True)
         else:
+            self._details_mission_id = None
             self.details_text.clear()
             self.select_btn.setEnabled(False)
 
     def select_mission(self):
         """Select the currently highlighted mission."""
-        selected_rows = self.missions_table.selectionModel().selectedRows()
-        if not selected_rows:
+        mission_data = self._selected_mission_data()
+        if not mission_data:
             QMessageBox.warning(self, "No Selection", "Please select a mission first.")
             return
 
-        row = selected_rows[0].row()
-        mission_data = self.missions_table.item(row, 0).data(Qt.UserRole)
-
-        if mission_data:
-            self.selected_mission = mission_data
-            self.accept()
-        else:
-            QMessageBox.warning(self, "Error", "Could not retrieve mission data.")
+        self.selected_mission = mission_data
+        self.accept()
 
     def get_selected_mission(self):
         """Get the selected mission data."""
         return self.selected_mission
 
 
+class DropdownDelegate(QStyledItemDelegate):
+    """
+    Combo box editor over a shared option model.
+    With store_id the cell holds the chosen option's ID (its UserRole data), otherwise its text.
+    """
+
+    def __init__(self, options_model, store_id=False, parent=None):
+        super().__init__(parent)
+        self.options_model = options_model
+        self.store_id = store_id
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setModel(self.options_model)
+        # Commit as soon as an entry is picked, like a dropdown menu
+        combo.activated.connect(lambda: self._commit_and_close(combo))
+        return combo
+
+    def _commit_and_close(self, combo):
+        self.commitData.emit(combo)
+        self.closeEditor.emit(combo)
+
+    def setEditorData(self, editor, index):
+        current_text = (index.data(Qt.EditRole) or "").strip()
+        if self.store_id:
+            position = editor.findData(int(current_text)) if current_text.isdigit() else -1
+        else:
+            position = editor.findText(current_text)
+        if position >= 0:
+            editor.setCurrentIndex(position)
+
+    def setModelData(self, editor, model, index):
+        if self.store_id:
+            option_id = editor.currentData()
+            value = str(option_id) if option_id is not None else ""
+        else:
+            value = editor.currentText()
+        # The table model reports the change to the tracker widget as a user edit
+        model.setData(index, value, Qt.EditRole)
+
+
 class FolderPathDelegate(QStyledItemDelegate):
     """Custom delegate to display a button for folder path selection."""
 
@@ -1657,17 +2024,17 @@ class FolderPathDelegate(QStyledItemDelegate):
         folder_path = index.data(Qt.DisplayRole) or ""
 
         # Create button appearance
-        button_text = "📁 Set Folder" if not folder_path else f"📁 {os.path.basename(folder_path) if folder_path else 'Set Folder'}"
+        button_text = _folder_button_text(folder_path)
 
         # Draw button-like background
-        painter.fillRect(option.rect, QColor("#e3f2fd"))  # Light blue background
+        painter.fillRect(option.rect, FOLDER_BUTTON_BACKGROUND)
 
         # Draw border
-        painter.setPen(QColor("#1976d2"))
+        painter.setPen(FOLDER_BUTTON_BORDER)
         painter.drawRect(option.rect.adjusted(0, 0, -1, -1))
 
         # Draw text
-        painter.setPen(QColor("#0d47a1"))
+        painter.setPen(FOLDER_BUTTON_TEXT)
         painter.drawText(option.rect, Qt.AlignCenter, button_text)
 
     def editorEvent(self, event, model, option, index):
@@ -1690,10 +2057,6 @@ class FolderPathDelegate(QStyledItemDelegate):
         )
 
         if folder_path:
-            # Update the model data
+            # Update the model data; the table model reports the edit to the tracker widget
             model = index.model()
             model.setData(index, folder_path, Qt.EditRole)
-
-            # Trigger edit handling
-            if hasattr(self.parent_table, 'parent') and hasattr(self.parent_table.parent(), 'cell_was_edited'):
-                self.parent_table.parent().cell_was_edited(index.row(), index.column())
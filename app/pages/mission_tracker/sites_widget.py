@@ -398,6 +398,7 @@ class SitesManagementWidget(QWidget):
 
                     db_manager.session.execute(query, site_data)
                     db_manager.session.commit()
+                    db_manager.sites_updated.emit()  # Notify other components of site changes
 
                     self.load_sites()
                     QMessageBox.information(self, "Success", "Site added successfully.")
@@ -452,6 +453,7 @@ class SitesManagementWidget(QWidget):
                     print(f"Final update data: {updated_data}")
                     db_manager.session.execute(query, updated_data)
                     db_manager.session.commit()
+                    db_manager.sites_updated.emit()  # Notify other components of site changes
 
                     self.load_sites()
                     QMessageBox.information(self, "Success", "Site updated successfully.")
@@ -477,6 +479,7 @@ class SitesManagementWidget(QWidget):
                 query = text("DELETE FROM sites WHERE site_ID = :site_id")
                 db_manager.session.execute(query, {'site_id': self.current_site['id']})
                 db_manager.session.commit()
+                db_manager.sites_updated.emit()  # Notify other components of site changes
 
                 self.load_sites()
                 self.clear_site_details()